@@ -51,6 +51,9 @@ class ConfigDialog(QDialog):
     enable_qt_quick_checkbox: QCheckBox
     keyword_rules_list: QListWidget
 
+    # 表单配置项控件，键为控件属性名，由 ConfigDialogUI 创建时填充
+    fields: Dict[str, QWidgetType]
+
     # 按钮属性
     ok_button: QPushButton
     cancel_button: QPushButton
@@ -74,25 +77,36 @@ class ConfigDialog(QDialog):
             self.setMinimumSize(500, 700)  # 设置最小尺寸
             self.resize(550, 750)  # 设置默认尺寸
 
+            self.fields = {}
+
             # 初始化UI管理器和逻辑处理器
             self.ui_manager = ConfigDialogUI(self, self.config)
-            self.logic_handler = ConfigDialogLogic(typing.cast(typing.Any, self), self.config)
+            # 父窗口的配置更新回调只需解析一次
+            parent_update_config = getattr(parent, 'update_config', None) if parent is not None else None
+            self.logic_handler = ConfigDialogLogic(typing.cast(typing.Any, self), self.config,
+                                                   parent_update_config if callable(parent_update_config) else None)
 
             # 设置窗口图标
             self.logic_handler.set_window_icon()
 
-            # 创建UI
-            self.ui_manager.create_ui()
+            # 创建控件和应用初始可见性规则期间暂停重绘，全部完成后统一刷新一次
+            # 控件的初始值在连接信号之前设置，构建过程中不会触发样式变化的处理函数
+            self.setUpdatesEnabled(False)
+            try:
+                # 创建UI
+                self.ui_manager.create_ui()
 
-            # 连接信号
-            self.logic_handler.connect_signals()
+                # 连接信号
+                self.logic_handler.connect_signals()
 
-            # 初始化后立即应用渲染后端规则（处理初始化时的状态）
-            # 此时所有UI组件都已创建
-            self.logic_handler.on_rendering_backend_changed(self.rendering_backend_combo.currentIndex())
+                # 初始化后立即应用渲染后端规则（处理初始化时的状态）
+                # 此时所有UI组件都已创建
+                self.logic_handler.on_rendering_backend_changed(self.rendering_backend_combo.currentIndex())
 
-            # 初始化后立即应用 Qt Quick 规则（处理初始化时的状态）
-            self.logic_handler.on_qt_quick_changed(self.enable_qt_quick_checkbox.checkState())
+                # 初始化后立即应用 Qt Quick 规则（处理初始化时的状态）
+                self.logic_handler.on_qt_quick_changed(self.enable_qt_quick_checkbox.checkState())
+            finally:
+                self.setUpdatesEnabled(True)
 
             logger.debug("配置对话框初始化完成")
         except Exception as e:
@@ -105,7 +119,7 @@ class ConfigDialog(QDialog):
         Args:
             style_text: 当前选择的样式文本
         """
-        logger.debug(f"横幅样式改变为: {style_text}")
+        logger.debug("横幅样式改变为: {}", style_text)
         # 获取当前选择的样式数据
         current_style = self.banner_style_combo.currentData()
 
@@ -185,7 +199,7 @@ class ConfigDialog(QDialog):
                     item_text = "[空模式]"
                 current_item.setText(item_text)
                 current_item.setData(Qt.ItemDataRole.UserRole, new_rule_data)
-                logger.debug(f"已编辑规则: {item_text}")
+                logger.debug("已编辑规则: {}", item_text)
         except Exception as e:
             logger.error(f"编辑规则时出错: {e}", exc_info=True)
 
@@ -256,6 +270,10 @@ class ConfigDialog(QDialog):
         """更新图标预览"""
         self.logic_handler.update_icon_preview()
 
+    def _ensure_deferred_groups(self) -> None:
+        """确保延迟加载的设置组已创建"""
+        self.ui_manager.ensure_deferred_groups()
+
     def _on_qt_quick_changed(self, state: Qt.CheckState) -> None:
         """当 Qt Quick 选项改变时，根据状态显示/隐藏渲染后端设置和透明度设置
 
@@ -5,15 +5,38 @@
 
 from PySide6.QtWidgets import (QWidget, QListWidgetItem, QPushButton, QFileDialog, QMessageBox, QLabel, QLineEdit,
                               QDoubleSpinBox, QSpinBox, QComboBox, QCheckBox)
-from PySide6.QtCore import (QObject, Qt, QEvent, QAbstractItemModel)
+from PySide6.QtCore import (QObject, Qt, QEvent, QTimer, QSignalBlocker)
 from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtGui import QStandardItemModel
 from logger_config import logger
 from config import save_config, get_config_path, DEFAULT_CONFIG
-from icon_manager import load_icon, get_resource_path, save_custom_icon
+from icon_manager import (load_icon, get_resource_path, save_custom_icon, get_preview_pixmap,
+                          invalidate_icon_cache)
+from keyword_replacer import reload_keyword_rules
+from config_dialog_ui import FIELDS, resolve_field_value, set_field_value, get_field_value
+import contextlib
 import os
 import typing
-from typing import List, Dict, Union
+from typing import Callable, List, Dict, Optional, Tuple, Union
+
+
+def _resolve_icon(icons_dir: str, icon_text: str) -> Tuple[str, Optional[float]]:
+    """解析自定义图标文件路径并获取修改时间
+
+    Args:
+        icons_dir: 图标目录
+        icon_text: 图标文件名
+
+    Returns:
+        Tuple[str, Optional[float]]: (图标完整路径, 修改时间)，文件名为空或文件不存在时修改时间为None
+    """
+    if not icon_text:
+        return "", None
+    icon_path = os.path.join(icons_dir, icon_text)
+    try:
+        return icon_path, os.stat(icon_path).st_mtime
+    except OSError:
+        return icon_path, None
 
 
 class TrayIconUpdateEvent(QEvent):
@@ -53,6 +76,7 @@ class ConfigDialog(QWidget):
     icon_preview_label: QLabel
     enable_qt_quick_checkbox: QCheckBox
     keyword_rules_list: QListWidgetItem
+    fields: Dict[str, QWidget]
     
     # 按钮属性
     ok_button: QPushButton
@@ -65,6 +89,12 @@ class ConfigDialog(QWidget):
     def setWindowIcon(self, icon: Union[QIcon, QPixmap]) -> None:
         pass
     
+    def setUpdatesEnabled(self, enable: bool) -> None:
+        pass
+    
+    def update(self) -> None:
+        pass
+    
     def accept(self) -> None:
         pass
     
@@ -86,9 +116,15 @@ class ConfigDialog(QWidget):
     def _on_rendering_backend_changed(self, index: int) -> None:
         pass
     
+    def _on_banner_style_changed(self, style_text: str) -> None:
+        pass
+    
     def _update_icon_preview(self) -> None:
         pass
     
+    def _ensure_deferred_groups(self) -> None:
+        pass
+    
     def _get_keyword_rules(self) -> List[Dict[str, Union[str, float, int, bool, None]]]:
         return []
     
@@ -105,16 +141,48 @@ class ConfigDialog(QWidget):
 class ConfigDialogLogic:
     """配置对话框逻辑处理器"""
 
-    def __init__(self, dialog: ConfigDialog, config: Dict[str, Union[str, float, int, bool, None]]) -> None:
+    # 透明的48x48默认预览图，首次使用时创建
+    _FALLBACK_PIXMAP: Optional[QPixmap] = None
+
+    def __init__(self, dialog: ConfigDialog, config: Dict[str, Union[str, float, int, bool, None]],
+                 parent_update_config: Optional[Callable[[], None]] = None) -> None:
         """
         初始化配置对话框逻辑处理器
 
         Args:
             dialog: 父级对话框实例
             config: 配置数据
+            parent_update_config: 图标变化后通知父窗口更新配置的回调
         """
         self.dialog = dialog
         self.config = config
+        self._parent_update_config = parent_update_config
+
+        # 缓存图标目录和默认图标路径，避免每次预览/保存时重复解析
+        self._config_dir = os.path.dirname(get_config_path())
+        self._icons_dir = os.path.join(self._config_dir, "icons")
+        # 内置默认图标在运行期间不会变化，只在初始化时检查一次文件是否存在
+        self._default_icon_paths: Dict[str, Tuple[str, float]] = {}
+        for name in ("notification_icon.ico", "notification_icon.png"):
+            path = get_resource_path(name)
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                logger.debug("默认图标文件不存在: {}", path)
+                continue
+            self._default_icon_paths[name] = (path, mtime)
+        # 上一次渲染预览时的图标键（文件名, 修改时间），默认图标使用 ("", 0.0)
+        self._last_icon_key: Optional[Tuple[str, float]] = None
+        # 渲染后端选择框中GPU选项的 (数据, 索引)，首次使用时查找
+        self._gpu_item_indexes: Optional[Tuple[Tuple[str, int], ...]] = None
+        # 渲染后端标签，首次使用时查找
+        self._rendering_backend_label: Optional[QLabel] = None
+
+        # 图标预览防抖定时器，连续输入时只在最后一次变化后更新预览
+        self._preview_timer = QTimer(self.dialog)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self.update_icon_preview)
 
     def set_window_icon(self) -> None:
         """设置配置对话框窗口图标"""
@@ -136,9 +204,7 @@ class ConfigDialogLogic:
         try:
             logger.debug("连接配置对话框信号")
 
-            # 连接图标选择相关信号
-            if hasattr(self.dialog, 'icon_edit') and self.dialog.icon_edit:
-                self.dialog.icon_edit.textChanged.connect(self.dialog._on_icon_changed)
+            # 图标编辑框的信号在延迟创建图标设置组时连接
 
             # 连接确定按钮
             self.dialog.ok_button.clicked.connect(self.dialog._on_accept)  # 修复方法名不匹配问题
@@ -167,7 +233,7 @@ class ConfigDialogLogic:
             )
 
             if file_path:
-                logger.debug(f"选择的图标文件: {file_path}")
+                logger.debug("选择的图标文件: {}", file_path)
 
                 # 保存图标文件到icons目录并使用UUID重命名
                 saved_filename = save_custom_icon(file_path)
@@ -179,7 +245,7 @@ class ConfigDialogLogic:
                     # 更新图标预览
                     self.dialog._update_icon_preview()
 
-                    logger.debug(f"图标文件已保存并重命名为: {saved_filename}")
+                    logger.debug("图标文件已保存并重命名为: {}", saved_filename)
                 else:
                     logger.error("保存图标文件失败")
                     QMessageBox.critical(self.dialog, "错误", "保存图标文件失败")
@@ -209,93 +275,71 @@ class ConfigDialogLogic:
             text (str): 新的图标文件名
         """
         try:
-            logger.debug(f"处理图标文本变化事件: {text}")
-            self.dialog._update_icon_preview()
+            logger.debug("处理图标文本变化事件: {}", text)
+            # 重新计时，避免逐字输入时反复渲染预览
+            self._preview_timer.start()
         except Exception as e:
             logger.error(f"处理图标文本变化事件时出错: {e}")
 
+    @classmethod
+    def _get_fallback(cls) -> QPixmap:
+        """获取透明背景的48x48默认预览图（首次使用时创建并缓存）
+
+        Returns:
+            QPixmap: 透明的预览图
+        """
+        if cls._FALLBACK_PIXMAP is None:
+            pixmap = QPixmap(48, 48)
+            pixmap.fill(Qt.GlobalColor.transparent)  # 使用透明背景
+            cls._FALLBACK_PIXMAP = pixmap
+        return cls._FALLBACK_PIXMAP
+
     def update_icon_preview(self) -> None:
         """更新图标预览"""
         try:
             logger.debug("更新图标预览")
 
             icon_text = self.dialog.icon_edit.text().strip()
-            if icon_text:
-                # 获取图标目录
-                config_dir = os.path.dirname(get_config_path())
-                icons_dir = os.path.join(config_dir, "icons")
-                icon_path = os.path.join(icons_dir, icon_text)
-
-                logger.debug(f"图标目录路径: {icons_dir}")
-
-                if os.path.exists(icon_path):
-                    icon = QIcon(icon_path)
-                    if not icon.isNull():
-                        # 使用更大的尺寸和更好的缩放质量来显示图标预览
-                        pixmap = icon.pixmap(48, 48, QIcon.Mode.Normal, QIcon.State.On)
-                        if pixmap.isNull():
-                            # 如果无法获取指定尺寸的pixmap，尝试使用默认尺寸
-                            available_sizes = icon.availableSizes()
-                            if available_sizes:
-                                pixmap = icon.pixmap(available_sizes[0])
-                            else:
-                                pixmap = QPixmap(48, 48)
-                                pixmap.fill(Qt.GlobalColor.transparent)  # 使用透明背景
-                        # 缩放到预览框大小，使用平滑变换
-                        pixmap = pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                        self.dialog.icon_preview_label.setPixmap(pixmap)
-                        logger.debug(f"图标预览已更新: {icon_path}")
-                        return
+            icon_path, icon_mtime = _resolve_icon(self._icons_dir, icon_text)
+            if icon_mtime is not None:
+                icon_key = (icon_text, icon_mtime)
+            else:
+                icon_key = ("", 0.0)
+
+            # 图标文件名和修改时间都未变化时无需重新渲染
+            if icon_key == self._last_icon_key:
+                logger.debug("图标未变化，跳过预览更新")
+                return
+
+            # 自定义图标
+            pixmap = get_preview_pixmap(icon_path, 48, icon_key[1]) if icon_key[0] else QPixmap()
+            if not pixmap.isNull():
+                self.dialog.icon_preview_label.setPixmap(pixmap)
+                self._last_icon_key = icon_key
+                logger.debug("图标预览已更新: {}", icon_path)
+                return
 
             # 使用默认图标预览
             logger.debug("使用默认图标预览")
-            # 尝试加载notification_icon.ico
-            resource_icon_path = get_resource_path("notification_icon.ico")
-            logger.debug(f"尝试加载ICO图标: {resource_icon_path}")
-            if os.path.exists(resource_icon_path):
-                icon = QIcon(resource_icon_path)
-                if not icon.isNull():
-                    pixmap = icon.pixmap(48, 48, QIcon.Mode.Normal, QIcon.State.On)
-                    available_sizes = icon.availableSizes()
-                    if pixmap.isNull() and available_sizes:
-                        pixmap = icon.pixmap(available_sizes[0])
-                    if not pixmap.isNull():
-                        # 缩放到预览框大小，使用平滑变换
-                        pixmap = pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                        self.dialog.icon_preview_label.setPixmap(pixmap)
-                        logger.debug("已显示notification_icon.ico默认图标")
-                        return
-
-            # 尝试加载notification_icon.png
-            resource_icon_path = get_resource_path("notification_icon.png")
-            logger.debug(f"尝试加载PNG图标: {resource_icon_path}")
-            if os.path.exists(resource_icon_path):
-                icon = QIcon(resource_icon_path)
-                if not icon.isNull():
-                    pixmap = icon.pixmap(48, 48, QIcon.Mode.Normal, QIcon.State.On)
-                    available_sizes = icon.availableSizes()
-                    if pixmap.isNull() and available_sizes:
-                        pixmap = icon.pixmap(available_sizes[0])
-                    if not pixmap.isNull():
-                        pixmap = pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                        self.dialog.icon_preview_label.setPixmap(pixmap)
-                        logger.debug("已显示notification_icon.png默认图标")
-                        return
+            # 依次尝试内置的ICO和PNG默认图标
+            for name, (resource_icon_path, resource_mtime) in self._default_icon_paths.items():
+                logger.debug("尝试加载默认图标: {}", resource_icon_path)
+                pixmap = get_preview_pixmap(resource_icon_path, 48, resource_mtime)
+                if not pixmap.isNull():
+                    self.dialog.icon_preview_label.setPixmap(pixmap)
+                    self._last_icon_key = icon_key
+                    logger.debug("已显示{}默认图标", name)
+                    return
 
             # 如果所有尝试都失败了，创建一个简单的默认图像
-            pixmap = QPixmap(48, 48)
-            pixmap.fill(Qt.GlobalColor.transparent)  # 使用透明背景
-            self.dialog.icon_preview_label.setPixmap(pixmap)
+            self.dialog.icon_preview_label.setPixmap(self._get_fallback())
+            self._last_icon_key = icon_key
             logger.debug("使用透明背景作为默认图标")
         except Exception as e:
             logger.error(f"更新图标预览时出错: {e}")
+            self._last_icon_key = None
             # 出错时显示一个简单的默认图像
-            try:
-                pixmap = QPixmap(48, 48)
-                pixmap.fill(Qt.GlobalColor.transparent)  # 使用透明背景
-                self.dialog.icon_preview_label.setPixmap(pixmap)
-            except Exception as e2:
-                logger.error(f"设置默认图标预览时出错: {e2}")
+            self.dialog.icon_preview_label.setPixmap(self._get_fallback())
 
     def on_qt_quick_changed(self, state: Qt.CheckState) -> None:
         """当 Qt Quick 选项改变时，根据状态显示/隐藏渲染后端设置和透明度设置
@@ -303,12 +347,12 @@ class ConfigDialogLogic:
         Args:
             state: Qt Quick 复选框的状态
         """
-        logger.debug(f"Qt Quick 选项改变，状态: {state}")
+        logger.debug("Qt Quick 选项改变，状态: {}", state)
         if state == Qt.CheckState.Checked:
             # 启用 Qt Quick 时隐藏渲染后端设置，但显示透明度设置
             self.dialog.rendering_backend_combo.hide()
             # 查找渲染后端标签并隐藏它
-            label = self.dialog.rendering_backend_combo.parent().findChild(QLabel, "rendering_backend_label")
+            label = self._get_rendering_backend_label()
             if label:
                 label.hide()
 
@@ -321,7 +365,7 @@ class ConfigDialogLogic:
             # 禁用 Qt Quick 时显示渲染后端设置，透明度设置的显示由渲染后端决定
             self.dialog.rendering_backend_combo.show()
             # 查找渲染后端标签并显示它
-            label = self.dialog.rendering_backend_combo.parent().findChild(QLabel, "rendering_backend_label")
+            label = self._get_rendering_backend_label()
             if label:
                 label.show()
 
@@ -330,6 +374,17 @@ class ConfigDialogLogic:
 
             logger.debug("显示渲染后端设置，透明度设置由渲染后端决定")
 
+    def _get_rendering_backend_label(self) -> Optional[QLabel]:
+        """获取渲染后端标签，结果会被缓存
+
+        Returns:
+            Optional[QLabel]: 渲染后端标签，找不到时返回None
+        """
+        if self._rendering_backend_label is None:
+            self._rendering_backend_label = self.dialog.rendering_backend_combo.parent().findChild(
+                QLabel, "rendering_backend_label")
+        return self._rendering_backend_label
+
     def on_qt_quick_state_changed(self, state: int) -> None:
         """Qt Quick 复选框状态改变处理函数
 
@@ -340,44 +395,33 @@ class ConfigDialogLogic:
 
     def update_gpu_options_enabled(self) -> None:
         """根据当前横幅样式更新GPU选项的启用/禁用状态"""
-        current_style = self.dialog.banner_style_combo.currentData()
-        gpu_items = ["opengl", "opengles"]
+        # 使用默认横幅样式时不允许选择GPU渲染，使用警告样式时GPU选项可用
+        enabled = self.dialog.banner_style_combo.currentData() != "default"
 
         # 获取模型
-        model: QAbstractItemModel = self.dialog.rendering_backend_combo.model()
-
-        if current_style == "default":
-            # 使用默认横幅样式时不允许选择GPU渲染
-            for i in range(self.dialog.rendering_backend_combo.count()):
-                item_data = self.dialog.rendering_backend_combo.itemData(i)
-                if item_data in gpu_items:
-                    index = model.index(i, 0)
-                    item = model.data(index, Qt.ItemDataRole.UserRole)
-                    if index.isValid():
-                        flags = model.flags(index)
-                        # 移除启用标志
-                        flags = flags & ~Qt.ItemFlag.ItemIsEnabled
-                        # 通过模型索引获取项并设置标志
-                        item = typing.cast(QStandardItemModel, model).itemFromIndex(index)
-                        if hasattr(item, 'setFlags'):
-                            item.setFlags(flags)
-                        logger.debug(f"禁用GPU选项: {item_data}")
-        else:
-            # 使用警告样式时，GPU选项可用
-            for i in range(self.dialog.rendering_backend_combo.count()):
-                item_data = self.dialog.rendering_backend_combo.itemData(i)
-                if item_data in gpu_items:
-                    index = model.index(i, 0)
-                    item = model.data(index, Qt.ItemDataRole.UserRole)
-                    if index.isValid():
-                        flags = model.flags(index)
-                        # 添加启用标志
-                        flags = flags | Qt.ItemFlag.ItemIsEnabled
-                        # 通过模型索引获取项并设置标志
-                        item = typing.cast(QStandardItemModel, model).itemFromIndex(index)
-                        if hasattr(item, 'setFlags'):
-                            item.setFlags(flags)
-                        logger.debug(f"启用GPU选项: {item_data}")
+        model = typing.cast(QStandardItemModel, self.dialog.rendering_backend_combo.model())
+
+        # GPU选项的索引只需查找一次
+        if self._gpu_item_indexes is None:
+            self._gpu_item_indexes = tuple(
+                (key, self.dialog.rendering_backend_combo.findData(key)) for key in ("opengl", "opengles")
+            )
+
+        for item_data, i in self._gpu_item_indexes:
+            if i < 0:
+                continue
+            item = model.item(i)
+            if item is None:
+                continue
+            flags = item.flags()
+            if enabled:
+                # 添加启用标志
+                item.setFlags(flags | Qt.ItemFlag.ItemIsEnabled)
+                logger.debug("启用GPU选项: {}", item_data)
+            else:
+                # 移除启用标志
+                item.setFlags(flags & ~Qt.ItemFlag.ItemIsEnabled)
+                logger.debug("禁用GPU选项: {}", item_data)
 
     def on_rendering_backend_changed(self, index: int) -> None:
         """当渲染后端改变时，根据是否为GPU模式控制透明度设置的可见性，
@@ -386,7 +430,7 @@ class ConfigDialogLogic:
         Args:
             index: 渲染后端选择框的新索引
         """
-        logger.debug(f"渲染后端改变，索引: {index}")
+        logger.debug("渲染后端改变，索引: {}", index)
         current_backend = self.dialog.rendering_backend_combo.currentData()
         is_gpu = current_backend in ["opengl", "opengles"]
 
@@ -427,74 +471,46 @@ class ConfigDialogLogic:
         try:
             logger.debug("处理确定事件")
 
+            # 图标和关键字规则控件延迟创建，读取前确保已创建
+            self.dialog._ensure_deferred_groups()
+
             # 保存当前配置（用于比较图标是否变化）
             old_icon = self.config.get("custom_icon")
+            old_rules = self.config.get("keyword_replacements")
 
             # 构建新配置
+            # 表单配置项按 FIELDS 描述统一读取，与创建和更新控件时使用同一份描述
+            fields = self.dialog.fields
             new_config: Dict[str, Union[str, float, int, bool, List[Dict[str, Union[str, float, int, bool, None]]], None]] = {
-                # 基本设置
-                "notification_title": self.dialog.title_edit.text(),
-                "scroll_speed": self.dialog.speed_spinbox.value(),
-                "scroll_count": self.dialog.scroll_count_spinbox.value(),
-                "click_to_close": self.dialog.click_close_spinbox.value(),
-
-                # 显示设置
-                "label_spacing": self.dialog.spacing_spinbox.value(),
-                "font_size": self.dialog.font_size_spinbox.value(),
-                "left_margin": self.dialog.left_margin_spinbox.value(),
-                "right_margin": self.dialog.right_margin_spinbox.value(),
-                "icon_scale": self.dialog.icon_scale_spinbox.value(),
-                "label_offset_x": self.dialog.label_offset_x_spinbox.value(),
-                "window_height": self.dialog.window_height_spinbox.value(),
-                "label_mask_width": self.dialog.label_mask_width_spinbox.value(),
-                "banner_spacing": self.dialog.banner_spacing_spinbox.value(),
-                "base_vertical_offset": self.dialog.base_vertical_offset_spinbox.value(),
-                "banner_opacity": self.dialog.banner_opacity_spinbox.value(),
-                "scroll_mode": self.dialog.scroll_mode_combo.currentData(),
-                "banner_style": self.dialog.banner_style_combo.currentData(),
-
-                # 动画设置
-                "shift_animation_duration": self.dialog.shift_duration_spinbox.value(),
-                "fade_animation_duration": self.dialog.fade_duration_spinbox.value(),
-
-                # 高级设置
-                "log_level": self.dialog.log_level_combo.currentData(),
-                "ignore_duplicate": self.dialog.ignore_duplicate_checkbox.isChecked(),
-                "do_not_disturb": self.dialog.dnd_checkbox.isChecked(),
-                "rendering_backend": self.dialog.rendering_backend_combo.currentData(),
-                "enable_qt_quick": self.dialog.enable_qt_quick_checkbox.isChecked(),
-
-                # 辅助功能设置
-                "accessibility_block_seewo_popup": getattr(self.dialog, 'seewo_block_checkbox', None) and self.dialog.seewo_block_checkbox.isChecked(),
+                spec.key: get_field_value(fields[spec.attr], spec) for specs in FIELDS.values() for spec in specs
+            }
 
-                # 图标设置
-                "custom_icon": self.dialog.icon_edit.text() or None,
+            # 图标设置
+            new_config["custom_icon"] = self.dialog.icon_edit.text() or None
 
-                # 关键字替换
-                "keyword_replacements": self.dialog._get_keyword_rules()
-            }
+            # 关键字替换
+            new_config["keyword_replacements"] = self.dialog._get_keyword_rules()
 
-            # 转换配置类型以匹配 save_config 函数的期望类型
-            save_config_data: Dict[str, Union[str, float, int, bool, None]] = {}
-            for key, value in new_config.items():
-                if key != "keyword_replacements":
-                    save_config_data[key] = value  # type: ignore
-            save_config_data["keyword_replacements"] = new_config["keyword_replacements"]  # type: ignore
+            # 配置未发生变化时无需写入文件和重新加载规则
+            if all(self.config.get(key) == value for key, value in new_config.items()):
+                logger.debug("配置未变化，跳过保存")
+                self.dialog.accept()
+                return
 
             # 保存新配置
-            if save_config(save_config_data):
+            if save_config(new_config):  # type: ignore
                 logger.info("配置已保存")
 
                 # 更新当前配置
-                self.config = save_config_data  # type: ignore
+                self.config = new_config  # type: ignore
 
-                # 重新加载关键字替换规则
-                try:
-                    from keyword_replacer import reload_keyword_rules
-                    reload_keyword_rules()
-                    logger.debug("关键字替换规则已重新加载")
-                except Exception as e:
-                    logger.error(f"重新加载关键字替换规则时出错: {e}")
+                # 关键字替换规则发生变化时才重新加载
+                if old_rules != self.config.get("keyword_replacements"):
+                    try:
+                        reload_keyword_rules(self.config)
+                        logger.debug("关键字替换规则已重新加载")
+                    except Exception as e:
+                        logger.error(f"重新加载关键字替换规则时出错: {e}")
 
                 # 如果图标发生变化，删除旧图标文件（如果不再使用）
                 new_icon = self.config.get("custom_icon")
@@ -502,13 +518,11 @@ class ConfigDialogLogic:
                     # 检查旧图标是否还在使用
                     if not self._is_icon_in_use(old_icon):
                         # 删除旧图标文件
-                        config_dir = os.path.dirname(get_config_path())
-                        icons_dir = os.path.join(config_dir, "icons")
-                        old_icon_path = os.path.join(icons_dir, old_icon)
+                        old_icon_path = os.path.join(self._icons_dir, old_icon)
                         if os.path.exists(old_icon_path):
                             try:
                                 os.remove(old_icon_path)
-                                logger.debug(f"已删除旧图标文件: {old_icon_path}")
+                                logger.debug("已删除旧图标文件: {}", old_icon_path)
                             except Exception as e:
                                 logger.error(f"删除旧图标文件失败: {old_icon_path}, 错误: {e}")
 
@@ -516,9 +530,11 @@ class ConfigDialogLogic:
                 if (old_icon is None and new_icon is not None) or \
                    (old_icon is not None and new_icon is None) or \
                    (old_icon != new_icon):
-                    if hasattr(self.dialog, 'parent') and self.dialog.parent() and hasattr(self.dialog.parent(), 'update_config'):
+                    # 释放旧图标对应的缓存
+                    invalidate_icon_cache()
+                    if self._parent_update_config is not None:
                         try:
-                            self.dialog.parent().update_config()  # type: ignore
+                            self._parent_update_config()
                         except Exception:
                             pass
                 self.dialog.accept()
@@ -543,12 +559,8 @@ class ConfigDialogLogic:
         if current_icon == icon_filename:
             return True
             
-        # 检查关键字规则中是否使用了这个图标
-        keyword_rules = self.dialog._get_keyword_rules()
-        for rule in keyword_rules:
-            # 如果将来关键字规则中可以设置图标，可以在这里检查
-            pass
-            
+        # 关键字规则目前不能设置图标，无需检查
+        # 如果将来关键字规则中可以设置图标，应复用 on_accept 中已获取的规则列表进行检查
         return False
 
     def on_cancel(self) -> None:
@@ -583,7 +595,7 @@ class ConfigDialogLogic:
                 no_button.setText("否")
 
             reply = msg_box.exec()
-            logger.debug(f"用户选择: {reply}")
+            logger.debug("用户选择: {}", reply)
 
             if reply == QMessageBox.StandardButton.Yes:
                 logger.debug("用户确认恢复默认设置")
@@ -614,77 +626,44 @@ class ConfigDialogLogic:
         try:
             logger.debug("根据配置更新UI控件")
 
-            # 基本设置
-            self.dialog.title_edit.setText(str(self.config.get("notification_title", "911 呼唤群")))
-            self.dialog.speed_spinbox.setValue(float(self.config.get("scroll_speed", 200.0) or 200.0))
-            self.dialog.scroll_count_spinbox.setValue(int(self.config.get("scroll_count", 3) or 3))
-            self.dialog.click_close_spinbox.setValue(int(self.config.get("click_to_close", 3) or 3))
-
-            # 显示设置
-            current_style = self.config.get("banner_style", "default")
-            style_index = self.dialog.banner_style_combo.findData(current_style)
-            if style_index >= 0:
-                self.dialog.banner_style_combo.setCurrentIndex(style_index)
-
-            self.dialog.spacing_spinbox.setValue(int(self.config.get("right_spacing", 150) or 150))
-            self.dialog.font_size_spinbox.setValue(float(self.config.get("font_size", 48.0) or 48.0))
-            self.dialog.left_margin_spinbox.setValue(int(self.config.get("left_margin", 93) or 93))
-            self.dialog.right_margin_spinbox.setValue(int(self.config.get("right_margin", 93) or 93))
-            self.dialog.icon_scale_spinbox.setValue(float(self.config.get("icon_scale", 1.0) or 1.0))
-            self.dialog.label_offset_x_spinbox.setValue(int(self.config.get("label_offset_x", 0) or 0))
-            self.dialog.window_height_spinbox.setValue(int(self.config.get("window_height", 128) or 128))
-            self.dialog.label_mask_width_spinbox.setValue(int(self.config.get("label_mask_width", 305) or 305))
-            self.dialog.banner_spacing_spinbox.setValue(int(self.config.get("banner_spacing", 10) or 10))
-            self.dialog.base_vertical_offset_spinbox.setValue(int(self.config.get("base_vertical_offset", 50) or 50))
-            self.dialog.banner_opacity_spinbox.setValue(float(self.config.get("banner_opacity", 0.9) or 0.9))
-
-            current_mode = self.config.get("scroll_mode", "always")
-            mode_index = self.dialog.scroll_mode_combo.findData(current_mode)
-            if mode_index >= 0:
-                self.dialog.scroll_mode_combo.setCurrentIndex(mode_index)
-
-            # 动画设置
-            self.dialog.shift_duration_spinbox.setValue(int(self.config.get("shift_animation_duration", 100) or 100))
-            self.dialog.fade_duration_spinbox.setValue(int(self.config.get("fade_animation_duration", 1500) or 1500))
-
-            # 高级设置
-            current_level = self.config.get("log_level", "INFO")
-            level_index = self.dialog.log_level_combo.findData(current_level)
-            if level_index >= 0:
-                self.dialog.log_level_combo.setCurrentIndex(level_index)
-
-            self.dialog.ignore_duplicate_checkbox.setChecked(bool(self.config.get("ignore_duplicate", False)))
-            self.dialog.dnd_checkbox.setChecked(bool(self.config.get("do_not_disturb", False)))
-            qt_quick_enabled = bool(self.config.get("enable_qt_quick", False))
-            self.dialog.enable_qt_quick_checkbox.setChecked(qt_quick_enabled)  # 添加 Qt Quick 选项
-
-            # 辅助功能
-            try:
-                self.dialog.seewo_block_checkbox.setChecked(bool(self.config.get("accessibility_block_seewo_popup", False)))
-            except Exception:
-                # 如果控件不存在或发生错误，静默忽略
-                pass
-
-            current_backend = self.config.get("rendering_backend", "default")
-            backend_index = self.dialog.rendering_backend_combo.findData(current_backend)
-            if backend_index >= 0:
-                self.dialog.rendering_backend_combo.setCurrentIndex(backend_index)
-            else:
-                # 如果找不到对应的数据，设置为默认值
-                default_index = self.dialog.rendering_backend_combo.findData("default")
-                if default_index >= 0:
-                    self.dialog.rendering_backend_combo.setCurrentIndex(default_index)
+            # 图标和关键字规则控件延迟创建，更新前确保已创建
+            self.dialog._ensure_deferred_groups()
+
+            # 批量更新期间暂停重绘，结束后统一刷新一次
+            self.dialog.setUpdatesEnabled(False)
+
+            # 批量设置期间屏蔽会触发联动处理的控件信号，结束后统一刷新一次
+            signal_widgets = (
+                self.dialog.icon_edit,
+                self.dialog.rendering_backend_combo,
+                self.dialog.banner_style_combo,
+                self.dialog.enable_qt_quick_checkbox,
+                self.dialog.scroll_mode_combo,
+                self.dialog.log_level_combo,
+            )
+            with contextlib.ExitStack() as stack:
+                for widget in signal_widgets:
+                    stack.enter_context(QSignalBlocker(widget))
+
+                # 表单配置项按 FIELDS 描述统一设置，取值规则与创建控件时一致
+                fields = self.dialog.fields
+                for specs in FIELDS.values():
+                    for spec in specs:
+                        set_field_value(fields[spec.attr], spec, resolve_field_value(spec, self.config))
+
+                # 图标设置
+                current_icon = self.config.get("custom_icon")
+                if current_icon:
+                    self.dialog.icon_edit.setText(str(current_icon))
+                else:
+                    self.dialog.icon_edit.clear()
+
+            # 信号恢复后统一应用样式和渲染后端规则（包含GPU选项可用性检查）
+            self.dialog._on_banner_style_changed(self.dialog.banner_style_combo.currentText())
 
             # 将Qt Quick的状态更新移到最后，确保所有依赖于此的UI都已更新
             self.dialog._on_qt_quick_changed(self.dialog.enable_qt_quick_checkbox.checkState())
 
-            # 图标设置
-            current_icon = self.config.get("custom_icon")
-            if current_icon:
-                self.dialog.icon_edit.setText(str(current_icon))
-            else:
-                self.dialog.icon_edit.clear()
-
             # 更新图标预览
             self.dialog._update_icon_preview()
 
@@ -693,4 +672,7 @@ class ConfigDialogLogic:
 
             logger.debug("UI控件更新完成")
         except Exception as e:
-            logger.error(f"根据配置更新UI控件时出错: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"根据配置更新UI控件时出错: {e}", exc_info=True)
+        finally:
+            self.dialog.setUpdatesEnabled(True)
+            self.dialog.update()
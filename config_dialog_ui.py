@@ -8,9 +8,172 @@ from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QFormLayout,
                                QPushButton, QGroupBox, QComboBox, QLabel,
                                QScrollArea, QWidget,
                                QFrame, QListWidget, QAbstractItemView)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from logger_config import logger
-from typing import Dict, Union
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
+
+
+# 日志等级选项
+_LOG_LEVELS = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+
+class FieldSpec(NamedTuple):
+    """表单配置项描述"""
+    attr: str                                  # 对话框上的控件属性名
+    label: str                                 # 标签文本
+    kind: str                                  # 控件类型: str / int / float / bool / combo
+    key: str                                   # 配置键
+    default: Union[str, float, int, bool]      # 默认值
+    range: Optional[Tuple[float, float]] = None
+    suffix: str = ""
+    step: Optional[float] = None
+    items: Tuple[Tuple[str, str], ...] = ()    # 下拉框选项: (显示文本, 数据)
+    label_attr: Optional[str] = None           # 需要保存标签控件时的属性名
+
+
+# 各设置组的表单配置项，按显示顺序排列
+FIELDS: Dict[str, Tuple[FieldSpec, ...]] = {
+    "basic": (
+        FieldSpec("title_edit", "通知标题:", "str", "notification_title", "911 呼唤群"),
+        FieldSpec("speed_spinbox", "滚动速度:", "float", "scroll_speed", 200.0, (1.0, 1000.0), " px/s"),
+        FieldSpec("scroll_count_spinbox", "滚动次数:", "int", "scroll_count", 3, (1, 100)),
+        FieldSpec("click_close_spinbox", "点击关闭次数:", "int", "click_to_close", 3, (1, 10)),
+    ),
+    "display": (
+        FieldSpec("banner_style_combo", "横幅样式:", "combo", "banner_style", "default",
+                  items=(("默认样式", "default"), ("警告样式", "warning"))),
+        FieldSpec("spacing_spinbox", "右侧间隔距离:", "int", "right_spacing", 150, (0, 1000), " px",
+                  label_attr="spacing_label"),
+        FieldSpec("font_size_spinbox", "字体大小:", "float", "font_size", 48.0, (1.0, 100.0), " px",
+                  label_attr="font_size_label"),
+        FieldSpec("left_margin_spinbox", "左侧边距:", "int", "left_margin", 93, (0, 500), " px",
+                  label_attr="left_margin_label"),
+        FieldSpec("right_margin_spinbox", "右侧边距:", "int", "right_margin", 93, (0, 500), " px",
+                  label_attr="right_margin_label"),
+        FieldSpec("icon_scale_spinbox", "图标缩放倍数:", "float", "icon_scale", 1.0, (0.1, 5.0), step=0.1,
+                  label_attr="icon_scale_label"),
+        FieldSpec("label_offset_x_spinbox", "标签文本x轴偏移:", "int", "label_offset_x", 0, (-500, 500), " px",
+                  label_attr="label_offset_x_label"),
+        FieldSpec("window_height_spinbox", "窗口高度:", "int", "window_height", 128, (20, 500), " px",
+                  label_attr="window_height_label"),
+        FieldSpec("label_mask_width_spinbox", "标签遮罩宽度:", "int", "label_mask_width", 305, (50, 1000), " px",
+                  label_attr="label_mask_width_label"),
+        FieldSpec("banner_spacing_spinbox", "横幅间隔:", "int", "banner_spacing", 10, (0, 100), " px"),
+        FieldSpec("base_vertical_offset_spinbox", "基础垂直偏移量:", "int", "base_vertical_offset", 50,
+                  (-1000, 1000), " px"),
+        # 横幅透明度，使用0-1范围的双精度浮点数
+        FieldSpec("banner_opacity_spinbox", "横幅透明度:", "float", "banner_opacity", 0.9, (0.0, 1.0), step=0.01,
+                  label_attr="banner_opacity_label"),
+        FieldSpec("scroll_mode_combo", "滚动模式:", "combo", "scroll_mode", "always",
+                  items=(("不论如何都滚动", "always"), ("可以展示完全的不滚动", "auto"))),
+    ),
+    "animation": (
+        FieldSpec("shift_duration_spinbox", "上移动画持续时间:", "int", "shift_animation_duration", 100,
+                  (0, 5000), " ms"),
+        FieldSpec("fade_duration_spinbox", "淡入淡出动画时间:", "float", "fade_animation_duration", 1500,
+                  (0, 10000), " ms"),
+    ),
+    "advanced": (
+        FieldSpec("log_level_combo", "日志等级:", "combo", "log_level", "INFO",
+                  items=tuple((level, level) for level in _LOG_LEVELS)),
+        FieldSpec("ignore_duplicate_checkbox", "忽略5分钟内的重复通知", "bool", "ignore_duplicate", False),
+        FieldSpec("dnd_checkbox", "免打扰模式", "bool", "do_not_disturb", False),
+        FieldSpec("enable_qt_quick_checkbox", "启用 Qt Quick (QML 渲染)", "bool", "enable_qt_quick", False),
+        FieldSpec("rendering_backend_combo", "渲染后端:", "combo", "rendering_backend", "default",
+                  items=(("默认 (CPU渲染)", "default"), ("OpenGL (GPU渲染)", "opengl"),
+                         ("OpenGL ES (GPU渲染)", "opengles")),
+                  label_attr="rendering_backend_label"),
+    ),
+    "accessibility": (
+        FieldSpec("seewo_block_checkbox", "拦截希沃管家弹窗拦截提示", "bool", "accessibility_block_seewo_popup", False),
+    ),
+}
+
+
+# 仅对默认样式有效的显示配置项，控件和标签属性名分别为 <name>_spinbox 与 <name>_label
+_DEFAULT_STYLE_ONLY = ("spacing", "left_margin", "right_margin", "icon_scale",
+                       "label_offset_x", "window_height", "label_mask_width", "font_size")
+
+# 各控件类型对应的值转换函数，下拉框保留原始数据用于 findData
+_CASTS: Dict[str, Callable[[Any], Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "combo": lambda value: value,
+}
+
+
+def resolve_field_value(spec: FieldSpec, config: Dict[str, Union[str, float, int, bool, None]]) -> Any:
+    """读取配置项并转换为控件需要的类型
+
+    只有缺失或为None时才使用默认值，0、空字符串等合法的假值会被保留。
+
+    Args:
+        spec: 配置项描述
+        config: 配置数据
+
+    Returns:
+        转换后的配置值，无法转换时返回默认值
+    """
+    value = config.get(spec.key)
+    if value is None:
+        return spec.default
+    try:
+        return _CASTS[spec.kind](value)
+    except (TypeError, ValueError):
+        logger.warning(f"配置项 {spec.key} 的值无效: {value!r}，使用默认值 {spec.default!r}")
+        return spec.default
+
+
+
+def set_field_value(widget: Any, spec: FieldSpec, value: Any) -> None:
+    """将已解析的配置值设置到对应控件上
+
+    Args:
+        widget: 配置项对应的控件
+        spec: 配置项描述
+        value: 由 resolve_field_value 解析后的配置值
+    """
+    if spec.kind == "str":
+        widget.setText(value)
+    elif spec.kind == "bool":
+        widget.setChecked(value)
+    elif spec.kind == "combo":
+        index = widget.findData(value)
+        if index < 0:
+            # 如果找不到对应的数据，设置为默认值
+            index = widget.findData(spec.default)
+        if index >= 0:
+            widget.setCurrentIndex(index)
+    else:
+        widget.setValue(value)
+
+
+def get_field_value(widget: Any, spec: FieldSpec) -> Any:
+    """读取控件上的配置值，与 set_field_value 相对应
+
+    Args:
+        widget: 配置项对应的控件
+        spec: 配置项描述
+
+    Returns:
+        控件当前的配置值
+    """
+    if spec.kind == "str":
+        return widget.text()
+    if spec.kind == "bool":
+        return widget.isChecked()
+    if spec.kind == "combo":
+        return widget.currentData()
+    return widget.value()
+
+# 配置对话框样式表，通过objectName选择器作用于具体控件
+_DIALOG_QSS = """
+QListWidget#keywordRulesList::item:selected {
+    background-color: #0078d4;
+    color: white;
+}
+"""
 
 
 class ConfigDialogUI:
@@ -26,13 +189,26 @@ class ConfigDialogUI:
         """
         self.dialog = dialog
         self.config = config
+        # 预先解析所有表单配置项的值，创建控件时直接读取
+        self._v: Dict[str, Any] = {
+            spec.key: resolve_field_value(spec, config)
+            for specs in FIELDS.values()
+            for spec in specs
+        }
         self.display_group = None
+        # 仅默认样式有效的配置项当前是否已隐藏（控件创建后默认可见）
+        self._style_hidden = False
+        # 延迟创建的设置组所在布局，设置组创建后置为 None
+        self._deferred_layout: Optional[QVBoxLayout] = None
 
     def create_ui(self) -> None:
         """创建UI界面"""
         try:
             logger.debug("开始创建配置对话框UI")
 
+            # 对话框的全部样式集中设置一次，在创建子控件之前设置可避免对已有控件重复polish
+            self.dialog.setStyleSheet(_DIALOG_QSS)
+
             # 创建主布局
             main_layout = QVBoxLayout(self.dialog)
 
@@ -45,212 +221,142 @@ class ConfigDialogUI:
             scroll_content = QWidget()
             scroll_layout = QVBoxLayout(scroll_content)
 
-            # 基本设置组
-            self._create_basic_settings_group(scroll_layout)
+            # 构建期间暂停滚动区域及其内容的重绘，避免每次添加控件都触发一轮布局和绘制
+            scroll_area.setUpdatesEnabled(False)
+            scroll_content.setUpdatesEnabled(False)
+            try:
+                # 基本设置组
+                scroll_layout.addWidget(self._build_form_group("基本设置", FIELDS["basic"]))
 
-            # 显示设置组
-            self._create_display_settings_group(scroll_layout)
+                # 显示设置组，保存对显示组的引用，以便在样式更改时访问
+                self.display_group = self._build_form_group("显示设置", FIELDS["display"])
+                scroll_layout.addWidget(self.display_group)
 
-            # 动画设置组
-            self._create_animation_settings_group(scroll_layout)
+                # 连接横幅样式变化信号
+                self.dialog.banner_style_combo.currentTextChanged.connect(self.dialog._on_banner_style_changed)
 
-            # 高级设置组
-            self._create_advanced_settings_group(scroll_layout)
+                # 初始化时根据当前样式隐藏无效配置
+                # 此时 rendering_backend_combo 尚未创建，因此不调用 _on_rendering_backend_changed
+                self.apply_banner_style_visibility(self.dialog.banner_style_combo.currentData())
 
-            # 辅助功能设置组
-            self._create_accessibility_group(scroll_layout)
+                # 动画设置组
+                scroll_layout.addWidget(self._build_form_group("动画设置", FIELDS["animation"]))
 
-            # 图标设置组
-            self._create_icon_settings_group(scroll_layout)
+                # 高级设置组
+                scroll_layout.addWidget(self._build_form_group("高级设置", FIELDS["advanced"]))
 
-            # 关键字替换设置组
-            self._create_keyword_replacement_group(scroll_layout)
+                # 连接 Qt Quick 选项变化信号
+                # Qt Quick 状态的初始化在 ConfigDialog 和 _update_ui_from_config 中统一处理
+                self.dialog.enable_qt_quick_checkbox.stateChanged.connect(self.dialog._on_qt_quick_state_changed)
 
-            # 将滚动内容设置到滚动区域
-            scroll_area.setWidget(scroll_content)
-            main_layout.addWidget(scroll_area)
+                # 辅助功能设置组
+                scroll_layout.addWidget(self._build_form_group("辅助功能", FIELDS["accessibility"]))
 
-            # 创建按钮布局
-            self._create_buttons(main_layout)
+                # 将滚动内容设置到滚动区域
+                scroll_area.setWidget(scroll_content)
+                main_layout.addWidget(scroll_area)
+
+                # 创建按钮布局
+                self._create_buttons(main_layout)
+            finally:
+                scroll_content.setUpdatesEnabled(True)
+                scroll_area.setUpdatesEnabled(True)
+
+            # 图标设置组和关键字替换设置组位于滚动区域末尾，且需要读取图标文件和规则，
+            # 延迟到事件循环空闲时再创建，让对话框先完成显示
+            self._deferred_layout = scroll_layout
+            QTimer.singleShot(0, self.ensure_deferred_groups)
 
             logger.debug("配置对话框UI创建完成")
         except Exception as e:
             logger.error(f"创建配置对话框UI时出错: {e}", exc_info=True)
             raise
 
-    def _create_basic_settings_group(self, parent_layout: QVBoxLayout) -> None:
-        """创建基本设置组"""
-        try:
-            logger.debug("创建基本设置组")
-
-            # 创建基本设置组
-            basic_group = QGroupBox("基本设置")
-            basic_layout = QFormLayout(basic_group)
-
-            # 通知标题
-            self.dialog.title_edit = QLineEdit()
-            self.dialog.title_edit.setText(str(self.config.get("notification_title", "911 呼唤群")))
-            basic_layout.addRow("通知标题:", self.dialog.title_edit)
-
-            # 滚动速度
-            self.dialog.speed_spinbox = QDoubleSpinBox()
-            self.dialog.speed_spinbox.setRange(1.0, 1000.0)
-            self.dialog.speed_spinbox.setValue(float(self.config.get("scroll_speed", 200.0) or 200.0))
-            self.dialog.speed_spinbox.setSuffix(" px/s")
-            basic_layout.addRow("滚动速度:", self.dialog.speed_spinbox)
-
-            # 滚动次数
-            self.dialog.scroll_count_spinbox = QSpinBox()
-            self.dialog.scroll_count_spinbox.setRange(1, 100)
-            self.dialog.scroll_count_spinbox.setValue(int(self.config.get("scroll_count", 3) or 3))
-            basic_layout.addRow("滚动次数:", self.dialog.scroll_count_spinbox)
-
-            # 点击关闭次数
-            self.dialog.click_close_spinbox = QSpinBox()
-            self.dialog.click_close_spinbox.setRange(1, 10)
-            self.dialog.click_close_spinbox.setValue(int(self.config.get("click_to_close", 3) or 3))
-            basic_layout.addRow("点击关闭次数:", self.dialog.click_close_spinbox)
+    def _build_form_group(self, title: str, specs: Tuple[FieldSpec, ...]) -> QGroupBox:
+        """根据配置项描述创建表单设置组
 
-            # 添加到父布局
-            parent_layout.addWidget(basic_group)
+        Args:
+            title: 设置组标题
+            specs: 配置项描述列表
 
-            logger.debug("基本设置组创建完成")
-        except Exception as e:
-            logger.error(f"创建基本设置组时出错: {e}", exc_info=True)
+        Returns:
+            QGroupBox: 创建好的设置组
+        """
+        group = QGroupBox(title)
+        layout = QFormLayout(group)
+        for spec in specs:
+            self._build_field(layout, spec)
+        return group
 
-    def _create_display_settings_group(self, parent_layout: QVBoxLayout) -> None:
-        """创建显示设置组"""
-        try:
-            logger.debug("创建显示设置组")
-
-            # 创建显示设置组
-            display_group = QGroupBox("显示设置")
-            display_layout = QFormLayout(display_group)
-
-            # 保存对显示组的引用，以便在样式更改时访问
-            self.display_group = display_group
-
-            # 横幅样式
-            self.dialog.banner_style_combo = QComboBox()
-            self.dialog.banner_style_combo.addItem("默认样式", "default")
-            self.dialog.banner_style_combo.addItem("警告样式", "warning")
-            current_style = self.config.get("banner_style", "default")
-            index = self.dialog.banner_style_combo.findData(current_style)
-            if index >= 0:
-                self.dialog.banner_style_combo.setCurrentIndex(index)
-            display_layout.addRow("横幅样式:", self.dialog.banner_style_combo)
-
-            # 右侧间隔距离
-            self.dialog.spacing_spinbox = QSpinBox()
-            self.dialog.spacing_spinbox.setRange(0, 1000)
-            self.dialog.spacing_spinbox.setValue(int(self.config.get("right_spacing", 150) or 150))
-            self.dialog.spacing_spinbox.setSuffix(" px")
-            self.dialog.spacing_label = QLabel("右侧间隔距离:")
-            display_layout.addRow(self.dialog.spacing_label, self.dialog.spacing_spinbox)
-
-            # 字体大小
-            self.dialog.font_size_spinbox = QDoubleSpinBox()
-            self.dialog.font_size_spinbox.setRange(1.0, 100.0)
-            self.dialog.font_size_spinbox.setValue(float(self.config.get("font_size", 48.0) or 48.0))
-            self.dialog.font_size_spinbox.setSuffix(" px")
-            self.dialog.font_size_label = QLabel("字体大小:")
-            display_layout.addRow(self.dialog.font_size_label, self.dialog.font_size_spinbox)
-
-            # 左侧边距
-            self.dialog.left_margin_spinbox = QSpinBox()
-            self.dialog.left_margin_spinbox.setRange(0, 500)
-            self.dialog.left_margin_spinbox.setValue(int(self.config.get("left_margin", 93) or 93))
-            self.dialog.left_margin_spinbox.setSuffix(" px")
-            self.dialog.left_margin_label = QLabel("左侧边距:")
-            display_layout.addRow(self.dialog.left_margin_label, self.dialog.left_margin_spinbox)
-
-            # 右侧边距
-            self.dialog.right_margin_spinbox = QSpinBox()
-            self.dialog.right_margin_spinbox.setRange(0, 500)
-            self.dialog.right_margin_spinbox.setValue(int(self.config.get("right_margin", 93) or 93))
-            self.dialog.right_margin_spinbox.setSuffix(" px")
-            self.dialog.right_margin_label = QLabel("右侧边距:")
-            display_layout.addRow(self.dialog.right_margin_label, self.dialog.right_margin_spinbox)
-
-            # 图标缩放倍数
-            self.dialog.icon_scale_spinbox = QDoubleSpinBox()
-            self.dialog.icon_scale_spinbox.setRange(0.1, 5.0)
-            self.dialog.icon_scale_spinbox.setValue(float(self.config.get("icon_scale", 1.0) or 1.0))
-            self.dialog.icon_scale_spinbox.setSingleStep(0.1)
-            self.dialog.icon_scale_label = QLabel("图标缩放倍数:")
-            display_layout.addRow(self.dialog.icon_scale_label, self.dialog.icon_scale_spinbox)
-
-            # 标签文本x轴偏移
-            self.dialog.label_offset_x_spinbox = QSpinBox()
-            self.dialog.label_offset_x_spinbox.setRange(-500, 500)
-            self.dialog.label_offset_x_spinbox.setValue(int(self.config.get("label_offset_x", 0) or 0))
-            self.dialog.label_offset_x_spinbox.setSuffix(" px")
-            self.dialog.label_offset_x_label = QLabel("标签文本x轴偏移:")
-            display_layout.addRow(self.dialog.label_offset_x_label, self.dialog.label_offset_x_spinbox)
-
-            # 窗口高度
-            self.dialog.window_height_spinbox = QSpinBox()
-            self.dialog.window_height_spinbox.setRange(20, 500)
-            self.dialog.window_height_spinbox.setValue(int(self.config.get("window_height", 128) or 128))
-            self.dialog.window_height_spinbox.setSuffix(" px")
-            self.dialog.window_height_label = QLabel("窗口高度:")
-            display_layout.addRow(self.dialog.window_height_label, self.dialog.window_height_spinbox)
-
-            # 标签遮罩宽度
-            self.dialog.label_mask_width_spinbox = QSpinBox()
-            self.dialog.label_mask_width_spinbox.setRange(50, 1000)
-            self.dialog.label_mask_width_spinbox.setValue(int(self.config.get("label_mask_width", 305) or 305))
-            self.dialog.label_mask_width_spinbox.setSuffix(" px")
-            self.dialog.label_mask_width_label = QLabel("标签遮罩宽度:")
-            display_layout.addRow(self.dialog.label_mask_width_label, self.dialog.label_mask_width_spinbox)
-
-            # 横幅间隔
-            self.dialog.banner_spacing_spinbox = QSpinBox()
-            self.dialog.banner_spacing_spinbox.setRange(0, 100)
-            self.dialog.banner_spacing_spinbox.setValue(int(self.config.get("banner_spacing", 10) or 10))
-            self.dialog.banner_spacing_spinbox.setSuffix(" px")
-            display_layout.addRow("横幅间隔:", self.dialog.banner_spacing_spinbox)
-
-            # 基础垂直偏移量
-            self.dialog.base_vertical_offset_spinbox = QSpinBox()
-            self.dialog.base_vertical_offset_spinbox.setRange(-1000, 1000)
-            self.dialog.base_vertical_offset_spinbox.setValue(int(self.config.get("base_vertical_offset", 50) or 50))
-            self.dialog.base_vertical_offset_spinbox.setSuffix(" px")
-            display_layout.addRow("基础垂直偏移量:", self.dialog.base_vertical_offset_spinbox)
-
-            # 添加横幅透明度设置，使用0-1范围的双精度浮点数
-            self.dialog.banner_opacity_spinbox = QDoubleSpinBox()
-            self.dialog.banner_opacity_spinbox.setRange(0.0, 1.0)
-            self.dialog.banner_opacity_spinbox.setValue(float(self.config.get("banner_opacity", 0.9) or 0.9))
-            self.dialog.banner_opacity_spinbox.setSingleStep(0.01)
-            self.dialog.banner_opacity_label = QLabel("横幅透明度:")
-            display_layout.addRow(self.dialog.banner_opacity_label, self.dialog.banner_opacity_spinbox)
-
-            # 滚动模式
-            self.dialog.scroll_mode_combo = QComboBox()
-            self.dialog.scroll_mode_combo.addItem("不论如何都滚动", "always")
-            self.dialog.scroll_mode_combo.addItem("可以展示完全的不滚动", "auto")
-            current_mode = self.config.get("scroll_mode", "always")
-            index = self.dialog.scroll_mode_combo.findData(current_mode)
-            if index >= 0:
-                self.dialog.scroll_mode_combo.setCurrentIndex(index)
-
-            display_layout.addRow("滚动模式:", self.dialog.scroll_mode_combo)
-
-            # 连接横幅样式变化信号
-            self.dialog.banner_style_combo.currentTextChanged.connect(self.dialog._on_banner_style_changed)
-
-            # 初始化时根据当前样式隐藏无效配置
-            # 此时 advanced_group 尚未创建，rendering_backend_combo 不存在
-            # 因此不调用 _on_rendering_backend_changed
-            self.apply_banner_style_visibility(self.dialog.banner_style_combo.currentData())
+    def _build_field(self, layout: QFormLayout, spec: FieldSpec) -> None:
+        """根据配置项描述创建单个控件，并保存到对话框对应属性和 fields 字典中
 
-            # 添加到父布局
-            parent_layout.addWidget(display_group)
+        Args:
+            layout: 所在表单布局
+            spec: 配置项描述
+        """
+        widget: QWidget
+        if spec.kind == "str":
+            widget = QLineEdit()
+        elif spec.kind == "bool":
+            widget = QCheckBox(spec.label)
+        elif spec.kind == "combo":
+            widget = QComboBox()
+            # 一次性添加全部选项，再逐项设置数据，避免每次addItem都触发一轮模型变更
+            widget.blockSignals(True)
+            widget.addItems([text for text, _ in spec.items])
+            for i, (_, data) in enumerate(spec.items):
+                widget.setItemData(i, data)
+            widget.blockSignals(False)
+        else:
+            widget = QDoubleSpinBox() if spec.kind == "float" else QSpinBox()
+            cast = float if spec.kind == "float" else int
+            if spec.range is not None:
+                widget.setRange(cast(spec.range[0]), cast(spec.range[1]))
+            if spec.suffix:
+                widget.setSuffix(spec.suffix)
+            if spec.step is not None:
+                widget.setSingleStep(spec.step)
+        set_field_value(widget, spec, self._v[spec.key])
+        setattr(self.dialog, spec.attr, widget)
+        self.dialog.fields[spec.attr] = widget
+
+        if spec.kind == "bool":
+            layout.addRow(widget)
+        elif spec.label_attr:
+            label = QLabel(spec.label)
+            label.setObjectName(spec.label_attr)
+            setattr(self.dialog, spec.label_attr, label)
+            layout.addRow(label, widget)
+        else:
+            layout.addRow(spec.label, widget)
+
+    def ensure_deferred_groups(self) -> None:
+        """创建延迟加载的设置组（图标设置组和关键字替换设置组）
 
-            logger.debug("显示设置组创建完成")
+        设置组只创建一次，已创建时直接返回。读取或更新这些设置组控件的代码
+        应先调用本方法，以免在延迟创建完成之前访问到不存在的控件。
+        """
+        parent_layout = self._deferred_layout
+        if parent_layout is None:
+            return
+        self._deferred_layout = None
+        try:
+            logger.debug("创建延迟加载的设置组")
+
+            # 此时对话框可能已经显示，添加期间同样暂停滚动内容的重绘
+            scroll_content = parent_layout.parentWidget()
+            scroll_content.setUpdatesEnabled(False)
+            try:
+                # 图标设置组
+                self._create_icon_settings_group(parent_layout)
+
+                # 关键字替换设置组
+                self._create_keyword_replacement_group(parent_layout)
+            finally:
+                scroll_content.setUpdatesEnabled(True)
         except Exception as e:
-            logger.error(f"创建显示设置组时出错: {e}", exc_info=True)
+            logger.error(f"创建延迟加载的设置组时出错: {e}", exc_info=True)
 
     def _create_icon_settings_group(self, parent_layout: QVBoxLayout) -> None:
         """创建图标设置组"""
@@ -316,166 +422,19 @@ class ConfigDialogUI:
         except Exception as e:
             logger.error(f"创建图标设置组时出错: {e}", exc_info=True)
 
-    def _create_accessibility_group(self, parent_layout: QVBoxLayout) -> None:
-        """创建辅助功能设置组"""
-        try:
-            logger.debug("创建辅助功能设置组")
-
-            access_group = QGroupBox("辅助功能")
-            access_layout = QFormLayout(access_group)
-
-            # 拦截希沃管家弹窗拦截提示
-            self.dialog.seewo_block_checkbox = QCheckBox("拦截希沃管家弹窗拦截提示")
-            self.dialog.seewo_block_checkbox.setChecked(bool(self.config.get("accessibility_block_seewo_popup", False)))
-            access_layout.addRow(self.dialog.seewo_block_checkbox)
-
-            parent_layout.addWidget(access_group)
-
-            logger.debug("辅助功能设置组创建完成")
-        except Exception as e:
-            logger.error(f"创建辅助功能设置组时出错: {e}", exc_info=True)
-
     def apply_banner_style_visibility(self, style_data: str) -> None:
         """根据横幅样式数据应用显示/隐藏逻辑"""
-        if style_data == "warning":
-            # 隐藏对警告样式无效的配置项
-            self.dialog.spacing_spinbox.hide()
-            self.dialog.left_margin_spinbox.hide()
-            self.dialog.right_margin_spinbox.hide()
-            self.dialog.icon_scale_spinbox.hide()
-            self.dialog.label_offset_x_spinbox.hide()
-            self.dialog.window_height_spinbox.hide()
-            self.dialog.label_mask_width_spinbox.hide()
-            self.dialog.font_size_spinbox.hide()
-            # 隐藏对应标签
-            self.dialog.spacing_label.hide()
-            self.dialog.left_margin_label.hide()
-            self.dialog.right_margin_label.hide()
-            self.dialog.icon_scale_label.hide()
-            self.dialog.label_offset_x_label.hide()
-            self.dialog.window_height_label.hide()
-            self.dialog.label_mask_width_label.hide()
-            self.dialog.font_size_label.hide()
-        else:
-            # 对于默认样式，显示所有配置项
-            self.dialog.spacing_spinbox.show()
-            self.dialog.left_margin_spinbox.show()
-            self.dialog.right_margin_spinbox.show()
-            self.dialog.icon_scale_spinbox.show()
-            self.dialog.label_offset_x_spinbox.show()
-            self.dialog.window_height_spinbox.show()
-            self.dialog.label_mask_width_spinbox.show()
-            self.dialog.font_size_spinbox.show()
-            # 显示对应标签
-            self.dialog.spacing_label.show()
-            self.dialog.left_margin_label.show()
-            self.dialog.right_margin_label.show()
-            self.dialog.icon_scale_label.show()
-            self.dialog.label_offset_x_label.show()
-            self.dialog.window_height_label.show()
-            self.dialog.label_mask_width_label.show()
-            self.dialog.font_size_label.show()
-
-    def _create_animation_settings_group(self, parent_layout: QVBoxLayout) -> None:
-        """创建动画设置组"""
-        try:
-            logger.debug("创建动画设置组")
-
-            # 创建动画设置组
-            animation_group = QGroupBox("动画设置")
-            animation_layout = QFormLayout(animation_group)
-
-            # 上移动画持续时间
-            self.dialog.shift_duration_spinbox = QSpinBox()
-            self.dialog.shift_duration_spinbox.setRange(0, 5000)
-            self.dialog.shift_duration_spinbox.setValue(int(self.config.get("shift_animation_duration", 100) or 100))
-            self.dialog.shift_duration_spinbox.setSuffix(" ms")
-            animation_layout.addRow("上移动画持续时间:", self.dialog.shift_duration_spinbox)
-
-            # 淡入淡出动画时间
-            self.dialog.fade_duration_spinbox = QDoubleSpinBox()  # 修复类型错误，应该使用 QDoubleSpinBox 而不是 QSpinBox
-            self.dialog.fade_duration_spinbox.setRange(0, 10000)
-            self.dialog.fade_duration_spinbox.setValue(int(self.config.get("fade_animation_duration", 1500) or 1500))
-            self.dialog.fade_duration_spinbox.setSuffix(" ms")
-            animation_layout.addRow("淡入淡出动画时间:", self.dialog.fade_duration_spinbox)
-
-            # 添加到父布局
-            parent_layout.addWidget(animation_group)
-
-            logger.debug("动画设置组创建完成")
-        except Exception as e:
-            logger.error(f"创建动画设置组时出错: {e}", exc_info=True)
-
-    def _create_advanced_settings_group(self, parent_layout: QVBoxLayout) -> None:
-        """创建高级设置组"""
-        try:
-            logger.debug("创建高级设置组")
-
-            # 创建高级设置组
-            advanced_group = QGroupBox("高级设置")
-            advanced_layout = QFormLayout(advanced_group)
-
-            # 日志等级
-            self.dialog.log_level_combo = QComboBox()
-            self.dialog.log_level_combo.addItem("TRACE", "TRACE")
-            self.dialog.log_level_combo.addItem("DEBUG", "DEBUG")
-            self.dialog.log_level_combo.addItem("INFO", "INFO")
-            self.dialog.log_level_combo.addItem("SUCCESS", "SUCCESS")
-            self.dialog.log_level_combo.addItem("WARNING", "WARNING")
-            self.dialog.log_level_combo.addItem("ERROR", "ERROR")
-            self.dialog.log_level_combo.addItem("CRITICAL", "CRITICAL")
-            current_level = self.config.get("log_level", "INFO")
-            index = self.dialog.log_level_combo.findData(current_level)
-            if index >= 0:
-                self.dialog.log_level_combo.setCurrentIndex(index)
-            advanced_layout.addRow("日志等级:", self.dialog.log_level_combo)
-
-            # 忽略重复通知
-            self.dialog.ignore_duplicate_checkbox = QCheckBox("忽略5分钟内的重复通知")
-            self.dialog.ignore_duplicate_checkbox.setChecked(bool(self.config.get("ignore_duplicate", False)))
-            advanced_layout.addRow(self.dialog.ignore_duplicate_checkbox)
-
-            # 免打扰模式
-            self.dialog.dnd_checkbox = QCheckBox("免打扰模式")
-            self.dialog.dnd_checkbox.setChecked(bool(self.config.get("do_not_disturb", False)))
-            advanced_layout.addRow(self.dialog.dnd_checkbox)
-
-            # 启用 Qt Quick 选项
-            self.dialog.enable_qt_quick_checkbox = QCheckBox("启用 Qt Quick (QML 渲染)")
-            self.dialog.enable_qt_quick_checkbox.setChecked(bool(self.config.get("enable_qt_quick", False)))
-            advanced_layout.addRow(self.dialog.enable_qt_quick_checkbox)
-
-            # 渲染后端选项
-            self.dialog.rendering_backend_combo = QComboBox()
-            self.dialog.rendering_backend_combo.addItem("默认 (CPU渲染)", "default")
-            self.dialog.rendering_backend_combo.addItem("OpenGL (GPU渲染)", "opengl")
-            self.dialog.rendering_backend_combo.addItem("OpenGL ES (GPU渲染)", "opengles")
-            current_backend = self.config.get("rendering_backend", "default")
-            index = self.dialog.rendering_backend_combo.findData(current_backend)
-            if index >= 0:
-                self.dialog.rendering_backend_combo.setCurrentIndex(index)
-            else:
-                # 如果找不到对应的数据，设置为默认值
-                default_index = self.dialog.rendering_backend_combo.findData("default")
-                if default_index >= 0:
-                    self.dialog.rendering_backend_combo.setCurrentIndex(default_index)
-            rendering_backend_label = QLabel("渲染后端:")
-            rendering_backend_label.setObjectName("rendering_backend_label")
-            advanced_layout.addRow(rendering_backend_label, self.dialog.rendering_backend_combo)
-
-            # 连接 Qt Quick 选项变化信号
-            self.dialog.enable_qt_quick_checkbox.stateChanged.connect(self.dialog._on_qt_quick_state_changed)
-
-            # 初始化 Qt Quick 状态
-            # 不再在这里调用_on_qt_quick_changed，而是在_update_ui_from_config中统一处理
-            # self._on_qt_quick_changed(self.enable_qt_quick_checkbox.checkState())
-
-            # 添加到父布局
-            parent_layout.addWidget(advanced_group)
-
-            logger.debug("高级设置组创建完成")
-        except Exception as e:
-            logger.error(f"创建高级设置组时出错: {e}", exc_info=True)
+        # 警告样式隐藏对其无效的配置项，其他样式显示所有配置项
+        hide = style_data == "warning"
+        # 显示状态未变化时无需逐个调用 show/hide 触发布局失效
+        if hide == self._style_hidden:
+            return
+        op = QWidget.hide if hide else QWidget.show
+        for name in _DEFAULT_STYLE_ONLY:
+            # 配置项及其对应标签
+            op(getattr(self.dialog, f"{name}_spinbox"))
+            op(getattr(self.dialog, f"{name}_label"))
+        self._style_hidden = hide
 
     def _create_buttons(self, parent_layout: QVBoxLayout) -> None:
         """创建按钮"""
@@ -525,12 +484,7 @@ class ConfigDialogUI:
             self.dialog.keyword_rules_list = QListWidget()
             self.dialog.keyword_rules_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
             self.dialog.keyword_rules_list.setAlternatingRowColors(True)
-            self.dialog.keyword_rules_list.setStyleSheet("""
-                QListWidget::item:selected {
-                    background-color: #0078d4;
-                    color: white;
-                }
-            """)
+            self.dialog.keyword_rules_list.setObjectName("keywordRulesList")
             list_layout.addWidget(self.dialog.keyword_rules_list)
 
             # 按钮布局
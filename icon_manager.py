@@ -6,46 +6,71 @@
 import os
 import sys
 import uuid
-from PySide6.QtGui import QIcon
+import weakref
+from functools import lru_cache
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache
 from logger_config import logger
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Callable, List
 
 
-def get_resource_path(relative_path: str) -> str:
-    """获取资源文件的绝对路径，兼容打包后的程序
+def _get_base_path() -> str:
+    """获取资源文件所在的基础目录，兼容打包后的程序
     
-    Args:
-        relative_path (str): 相对路径
-        
     Returns:
-        str: 资源文件的绝对路径
+        str: 基础目录的绝对路径
     """
-    # 获取可执行文件所在目录
-    base_path: str
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         # Nuitka单文件模式，资源在临时目录中
-        base_path = str(sys._MEIPASS)  # type: ignore
+        return str(sys._MEIPASS)  # type: ignore
     elif getattr(sys, 'frozen', False):
         # 其他打包模式
-        base_path = str(os.path.dirname(sys.executable))
+        return str(os.path.dirname(sys.executable))
     else:
         # 开发环境，使用__file__获取当前文件目录
-        base_path = str(os.path.dirname(os.path.abspath(__file__)))
+        return str(os.path.dirname(os.path.abspath(__file__)))
+
+
+# 基础目录在进程运行期间不会变化，模块导入时计算一次
+_BASE: str = _get_base_path()
+
+
+@lru_cache(maxsize=128)
+def get_resource_path(relative_path: str) -> str:
+    """获取资源文件的绝对路径，兼容打包后的程序
+    
+    相对路径只有少数几个固定值，结果会被缓存，重复调用只需一次字典查找。
+    
+    Args:
+        relative_path (str): 相对路径
         
+    Returns:
+        str: 资源文件的绝对路径
+    """
     # 确保relative_path是字符串类型
     relative_path_str: str = str(relative_path)
     # 构建完整路径
-    full_path: str = os.path.join(base_path, relative_path_str)
-    logger.debug(f"资源路径解析: {relative_path} -> {full_path}")
+    full_path: str = os.path.join(_BASE, relative_path_str)
+    logger.debug("资源路径解析: {} -> {}", relative_path, full_path)
     return full_path
 
 
+# 图标目录路径，首次成功获取（并确保目录存在）后缓存
+_ICONS_DIR: Optional[str] = None
+
+
 def get_icons_dir() -> Optional[str]:
     """获取图标目录路径
     
+    目录路径在运行期间不会变化，首次成功后缓存结果，后续调用不再访问文件系统。
+    
     Returns:
         str: 图标目录的绝对路径，如果创建失败则返回None
     """
+    global _ICONS_DIR
+    if _ICONS_DIR is not None:
+        return _ICONS_DIR
+
     # 使用与配置模块相同的方式获取基础目录，避免Nuitka单文件模式下保存到临时文件夹
     if getattr(sys, 'frozen', False):
         # 打包后的程序
@@ -58,15 +83,15 @@ def get_icons_dir() -> Optional[str]:
     icons_dir = os.path.join(config_dir, "icons")
     
     # 确保图标目录存在
-    if not os.path.exists(icons_dir):
-        try:
-            os.makedirs(icons_dir)
-            logger.debug(f"创建图标目录: {icons_dir}")
-        except Exception as e:
-            logger.error(f"创建图标目录失败: {e}")
-            return None
+    try:
+        os.makedirs(icons_dir, exist_ok=True)
+    except Exception as e:
+        # 创建失败时不缓存，下次调用时重试
+        logger.error(f"创建图标目录失败: {e}")
+        return None
             
-    logger.debug(f"图标目录路径: {icons_dir}")
+    logger.debug("图标目录路径: {}", icons_dir)
+    _ICONS_DIR = icons_dir
     return icons_dir
 
 
@@ -80,8 +105,8 @@ def save_custom_icon(icon_path: str) -> Optional[str]:
         str: 保存后的图标文件名（仅文件名），失败时返回None
     """
     try:
-        if not icon_path or not os.path.exists(icon_path):
-            logger.warning(f"图标文件不存在或路径无效: {icon_path}")
+        if not icon_path:
+            logger.warning(f"图标文件路径无效: {icon_path}")
             return None
             
         # 获取图标目录
@@ -99,96 +124,312 @@ def save_custom_icon(icon_path: str) -> Optional[str]:
         unique_filename = f"{uuid.uuid4()}{ext}"
         target_path = os.path.join(icons_dir, unique_filename)
         
-        # 复制文件
+        # 复制一份独立的文件，不使用硬链接：硬链接与用户的原文件共享同一份数据，
+        # 之后修改原文件会连带改变程序使用的图标。源文件不存在时由复制操作本身报告，无需事先检查
         import shutil
-        shutil.copy2(icon_path, target_path)
+        try:
+            shutil.copy2(icon_path, target_path)
+        except FileNotFoundError:
+            logger.warning(f"图标文件不存在: {icon_path}")
+            return None
         
-        logger.debug(f"图标文件已保存: {icon_path} -> {target_path}")
+        logger.debug("图标文件已保存: {} -> {}", icon_path, target_path)
         return unique_filename
     except Exception as e:
         logger.error(f"保存自定义图标时出错: {e}")
         return None
 
 
-def load_icon(config: Optional[Dict[str, Any]] = None) -> QIcon:
-    """加载图标
+@lru_cache(maxsize=64)
+def cached_qicon(path: str, mtime: float) -> QIcon:
+    """获取缓存的图标对象，同一文件只解析一次
     
     Args:
-        config (dict, optional): 配置字典
+        path (str): 图标文件路径
+        mtime (float): 图标文件修改时间，文件变化后会重新加载
         
     Returns:
-        QIcon: 加载的图标，如果失败则返回空图标
+        QIcon: 图标对象
+    """
+    logger.debug("加载图标文件: {}", path)
+    return QIcon(path)
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """获取文件修改时间，文件不存在时返回None，同时替代一次exists检查
+    
+    Args:
+        path (str): 文件路径
+        
+    Returns:
+        float: 文件修改时间，文件不存在或无法访问时返回None
     """
     try:
-        logger.debug("开始加载图标")
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _cached_preview_pixmap(path: str, size: int, mtime: float) -> QPixmap:
+    """生成并缓存指定大小的图标预览图
+    
+    只查询一次图标内嵌的尺寸列表：优先选择不小于目标大小的最小尺寸，
+    否则选择最大尺寸，再平滑缩放到目标大小。
+    
+    Args:
+        path (str): 图标文件路径
+        size (int): 预览图边长
+        mtime (float): 图标文件修改时间，文件变化后会重新生成
         
-        # 如果提供了配置且包含自定义图标设置，则优先加载自定义图标
-        if config and "custom_icon" in config:
-            custom_icon_filename = config.get("custom_icon")
-            if custom_icon_filename:
-                # 确保custom_icon_filename是字符串类型
-                custom_icon_filename = str(custom_icon_filename)
-                icons_dir = get_icons_dir()
-                if icons_dir:
-                    icon_path = os.path.join(icons_dir, custom_icon_filename)
-                    logger.debug(f"尝试加载自定义图标: {icon_path}")
-                    if os.path.exists(icon_path):
-                        icon = QIcon(icon_path)
-                        if not icon.isNull():
-                            logger.debug(f"成功加载自定义图标: {icon_path}")
-                            return icon
-                        else:
-                            logger.warning(f"自定义图标文件无效: {icon_path}")
-                    else:
-                        logger.warning(f"自定义图标文件不存在: {icon_path}")
-                else:
-                    logger.warning("无法获取图标目录")
-            else:
-                logger.debug("配置中custom_icon为空")
+    Returns:
+        QPixmap: 缩放后的预览图，无法生成时返回空的QPixmap
+    """
+    icon = cached_qicon(path, mtime)
+    if icon.isNull():
+        return QPixmap()
+
+    available_sizes = icon.availableSizes()
+    if available_sizes:
+        large_sizes = [s for s in available_sizes if s.width() >= size and s.height() >= size]
+        if large_sizes:
+            best_size = min(large_sizes, key=lambda s: s.width() * s.height())
         else:
-            logger.debug("配置中无自定义图标设置")
+            best_size = max(available_sizes, key=lambda s: s.width() * s.height())
+        pixmap = icon.pixmap(best_size, QIcon.Mode.Normal, QIcon.State.On)
+    else:
+        pixmap = icon.pixmap(size, size, QIcon.Mode.Normal, QIcon.State.On)
+
+    if pixmap.isNull():
+        return pixmap
+    # 缩放到预览框大小，使用平滑变换
+    return pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
+def get_preview_pixmap(path: str, size: int = 48, mtime: Optional[float] = None) -> QPixmap:
+    """获取图标的预览图，同一文件和大小只缩放一次
+    
+    Args:
+        path (str): 图标文件路径
+        size (int): 预览图边长，默认48
+        mtime (float, optional): 已知的文件修改时间，未提供时读取文件获取
         
-        # 如果没有自定义图标或加载失败，使用默认图标
+    Returns:
+        QPixmap: 缩放后的预览图，文件不存在或无法生成时返回空的QPixmap
+    """
+    if mtime is None:
+        mtime = _get_mtime(path)
+        if mtime is None:
+            return QPixmap()
+    return _cached_preview_pixmap(path, size, mtime)
+
+
+# 本模块写入QPixmapCache的键，失效时只移除这些键，不影响程序其他部分的缓存
+_SCALED_ICON_KEYS: Set[str] = set()
+
+
+def get_scaled_icon(icon: QIcon, size: int) -> QIcon:
+    """获取指定尺寸的图标，缩放后的位图存入QPixmapCache，同一图标和尺寸只渲染一次
+    
+    Args:
+        icon (QIcon): 原始图标，应来自load_icon等缓存接口以保证cacheKey稳定
+        size (int): 目标边长（像素）
+        
+    Returns:
+        QIcon: 只包含目标尺寸位图的图标，渲染失败时返回原始图标
+    """
+    key = f"scaled_icon:{icon.cacheKey()}:{size}"
+    pixmap = QPixmap()
+    if not QPixmapCache.find(key, pixmap):
+        pixmap = icon.pixmap(size, size)
+        if pixmap.isNull():
+            return icon
+        QPixmapCache.insert(key, pixmap)
+        _SCALED_ICON_KEYS.add(key)
+    return QIcon(pixmap)
+
+
+@lru_cache(maxsize=8)
+def _get_bundled_mtime(path: str) -> Optional[float]:
+    """获取内置资源文件的修改时间
+    
+    内置资源在程序运行期间不会变化，结果缓存后不再访问文件系统。
+    
+    Args:
+        path (str): 资源文件路径
+        
+    Returns:
+        float: 文件修改时间，文件不存在时返回None
+    """
+    return _get_mtime(path)
+
+
+# 已确认不存在的自定义图标路径，避免每次加载都重复访问文件系统
+_MISSING_PATHS: Set[str] = set()
+
+# 默认图标，首次成功加载后缓存，后续直接返回
+_DEFAULT_ICON: Optional[QIcon] = None
+
+
+def _get_default_icon() -> QIcon:
+    """获取默认图标，依次尝试内置ICO、内置PNG和系统主题图标
+    
+    Returns:
+        QIcon: 默认图标，全部失败时返回空图标
+    """
+    global _DEFAULT_ICON
+    if _DEFAULT_ICON is not None:
+        return _DEFAULT_ICON
+
+    try:
+        # 首先尝试内置ICO图标
         try:
             resource_icon_path = get_resource_path("notification_icon.ico")
-            logger.debug(f"尝试加载资源图标: {resource_icon_path}")
-            if os.path.exists(resource_icon_path):
-                icon = QIcon(resource_icon_path)
+            logger.debug("尝试加载资源图标: {}", resource_icon_path)
+            mtime = _get_bundled_mtime(resource_icon_path)
+            if mtime is not None:
+                icon = cached_qicon(resource_icon_path, mtime)
                 if not icon.isNull():
-                    logger.debug(f"成功加载资源图标: {resource_icon_path}")
+                    logger.debug("成功加载资源图标: {}", resource_icon_path)
+                    _DEFAULT_ICON = icon
                     return icon
                 else:
                     logger.warning(f"资源图标文件无效: {resource_icon_path}")
             else:
                 logger.warning(f"资源图标文件不存在: {resource_icon_path}")
         except Exception as e:
-            logger.debug(f"无法从资源加载图标: {e}")
-            
+            logger.debug("无法从资源加载图标: {}", e)
+        
         # 尝试使用notification_icon.png作为后备
         try:
             resource_icon_path = get_resource_path("notification_icon.png")
-            logger.debug(f"尝试加载PNG资源图标: {resource_icon_path}")
-            if os.path.exists(resource_icon_path):
-                icon = QIcon(resource_icon_path)
+            logger.debug("尝试加载PNG资源图标: {}", resource_icon_path)
+            mtime = _get_bundled_mtime(resource_icon_path)
+            if mtime is not None:
+                icon = cached_qicon(resource_icon_path, mtime)
                 if not icon.isNull():
-                    logger.debug(f"成功加载PNG资源图标: {resource_icon_path}")
+                    logger.debug("成功加载PNG资源图标: {}", resource_icon_path)
+                    _DEFAULT_ICON = icon
                     return icon
                 else:
                     logger.warning(f"PNG资源图标文件无效: {resource_icon_path}")
             else:
                 logger.warning(f"PNG资源图标文件不存在: {resource_icon_path}")
         except Exception as e:
-            logger.debug(f"无法从PNG资源加载图标: {e}")
-            
+            logger.debug("无法从PNG资源加载图标: {}", e)
+        
         # 尝试使用系统主题图标作为后备
         system_icon = QIcon.fromTheme("application-x-executable")
         if not system_icon.isNull():
             logger.debug("成功加载系统默认图标")
+            _DEFAULT_ICON = system_icon
             return system_icon
-            
+        
+        # 不缓存空图标，下次调用时重新尝试
         logger.warning("无法加载任何图标，返回空图标")
         return QIcon()
+    except Exception as e:
+        logger.error(f"加载默认图标时发生异常: {e}")
+        return QIcon()
+
+
+def preload_default_icon() -> None:
+    """预先加载默认图标
+    
+    QIcon必须在QApplication创建之后构造，因此无法在模块导入时加载，
+    由程序入口在创建QApplication后立即调用，之后所有回退路径都直接复用同一个图标对象。
+    """
+    _get_default_icon()
+
+
+# 图标缓存失效时需要通知的回调，以弱引用保存，不延长接收方的生命周期
+_CACHE_LISTENERS: List["weakref.WeakMethod[Callable[[], None]]"] = []
+
+
+def add_icon_cache_listener(callback: Callable[[], None]) -> None:
+    """注册图标缓存失效时调用的回调
+    
+    Args:
+        callback: 对象的绑定方法，对象被回收后自动失效
+    """
+    _CACHE_LISTENERS.append(weakref.WeakMethod(callback))
+
+
+def invalidate_icon_cache() -> None:
+    """清空图标、预览图、默认图标和缺失路径缓存，在图标配置变化后调用"""
+    global _DEFAULT_ICON
+    _DEFAULT_ICON = None
+    _MISSING_PATHS.clear()
+    cached_qicon.cache_clear()
+    _cached_preview_pixmap.cache_clear()
+    for key in _SCALED_ICON_KEYS:
+        QPixmapCache.remove(key)
+    _SCALED_ICON_KEYS.clear()
+
+    # 通知仍然存活的接收方，同时移除已被回收的弱引用
+    alive = []
+    for ref in _CACHE_LISTENERS:
+        callback = ref()
+        if callback is None:
+            continue
+        alive.append(ref)
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"执行图标缓存失效回调时出错: {e}")
+    _CACHE_LISTENERS[:] = alive
+
+
+def load_icon(config: Optional[Dict[str, Any]] = None) -> QIcon:
+    """加载图标
+    
+    Args:
+        config (dict, optional): 配置字典
+        
+    Returns:
+        QIcon: 加载的图标，如果失败则返回空图标
+    """
+    try:
+        logger.debug("开始加载图标")
+        
+        # 如果提供了配置且包含自定义图标设置，则优先加载自定义图标
+        if config and "custom_icon" in config:
+            custom_icon_filename = config.get("custom_icon")
+            if custom_icon_filename:
+                # 确保custom_icon_filename是字符串类型
+                custom_icon_filename = str(custom_icon_filename)
+                icons_dir = get_icons_dir()
+                if icons_dir:
+                    icon_path = os.path.join(icons_dir, custom_icon_filename)
+                    logger.debug("尝试加载自定义图标: {}", icon_path)
+                    # 已确认不存在的路径直接跳过，不再访问文件系统和重复输出警告
+                    mtime = None if icon_path in _MISSING_PATHS else _get_mtime(icon_path)
+                    if mtime is not None:
+                        icon = cached_qicon(icon_path, mtime)
+                        if not icon.isNull():
+                            logger.debug("成功加载自定义图标: {}", icon_path)
+                            return icon
+                        else:
+                            logger.warning(f"自定义图标文件无效: {icon_path}")
+                    elif icon_path in _MISSING_PATHS:
+                        logger.trace("自定义图标文件不存在（已缓存）: {}", icon_path)
+                    else:
+                        _MISSING_PATHS.add(icon_path)
+                        logger.warning(f"自定义图标文件不存在: {icon_path}")
+                else:
+                    logger.warning("无法获取图标目录")
+            else:
+                logger.debug("配置中custom_icon为空")
+        else:
+            logger.debug("配置中无自定义图标设置")
+        
+        # 如果没有自定义图标或加载失败，使用默认图标
+        return _get_default_icon()
         
     except Exception as e:
         logger.error(f"加载图标时发生异常: {e}")
-        return QIcon()
\ No newline at end of file
+        return _get_default_icon()
+
+
+# 清空图标缓存，供图标文件被外部替换等场景使用
+load_icon.cache_clear = invalidate_icon_cache  # type: ignore[attr-defined]
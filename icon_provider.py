@@ -3,17 +3,46 @@
 该模块为QML提供图标资源加载功能。
 """
 
-from PySide6.QtCore import QObject, Slot
-from icon_manager import load_icon
+import os
+from PySide6.QtCore import QObject, QUrl, Slot
+from config import load_config
+from icon_manager import get_icons_dir, add_icon_cache_listener
 from typing import Dict, Union, Optional
 
 
+# 没有可用的自定义图标时使用的内置图标
+_DEFAULT_ICON_URL = "qrc:/notification_icon.png"
+
+
 class IconProvider(QObject):
     """为QML提供图标资源的类"""
     
     def __init__(self, config: Optional[Dict[str, Union[str, float, int, bool, None]]] = None):
         super().__init__()
         self.config = config or {}
+        # 图标路径只在构造和配置变化时解析，QML查询时直接返回
+        self._cached_path: str = self._resolve_path()
+        # 图标配置变化后 invalidate_icon_cache 会调用 reload
+        add_icon_cache_listener(self.reload)
+    
+    def _resolve_path(self) -> str:
+        """解析图标路径，只检查自定义图标文件是否存在，不加载图标
+        
+        Returns:
+            str: 自定义图标的本地文件URL，没有可用的自定义图标时返回内置图标URL
+        """
+        try:
+            custom_icon = self.config.get("custom_icon")
+            if custom_icon:
+                icons_dir = get_icons_dir()
+                if icons_dir:
+                    custom_path = os.path.join(icons_dir, str(custom_icon))
+                    if os.path.isfile(custom_path):
+                        return QUrl.fromLocalFile(custom_path).toString()
+        except Exception:
+            # 出现异常时使用内置图标
+            pass
+        return _DEFAULT_ICON_URL
     
     @Slot(result=str)
     def getIconPath(self) -> str:
@@ -22,16 +51,10 @@ class IconProvider(QObject):
         Returns:
             str: 图标文件的QML URL路径
         """
-        try:
-            # 尝试加载图标
-            icon = load_icon(self.config)
-            if not icon.isNull():
-                # 在QML中我们无法直接使用QIcon，需要获取实际的图片路径
-                # 由于icon_manager已经处理了图标的加载，我们需要提供一个通用的图标路径
-                return "qrc:/notification_icon.png"
-            else:
-                # 返回默认图标路径
-                return ""
-        except Exception:
-            # 出现异常时返回空字符串
-            return ""
\ No newline at end of file
+        return self._cached_path
+    
+    @Slot()
+    def reload(self) -> None:
+        """重新读取配置并解析图标路径，在图标配置变化后调用"""
+        self.config = load_config()
+        self._cached_path = self._resolve_path()
@@ -4,17 +4,40 @@
 可以选择性地修改内容和/或字体样式。
 """
 
+import sys
 import regex as re
 import html
-from typing import List, Dict, Any, Tuple, Optional, Union
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Tuple, Optional, Union
 from PySide6.QtGui import QFont
 from config import load_config
 from logger_config import logger
 
 
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> "re.Pattern":  # type: ignore
+    """
+    编译正则表达式并缓存，相同模式的规则共享同一个编译结果
+    
+    Args:
+        pattern: 正则表达式
+        
+    Returns:
+        re.Pattern: 编译后的正则表达式
+        
+    Raises:
+        re.error: 正则表达式无效时抛出（失败结果不会被缓存）
+    """
+    return re.compile(pattern)
+
+
 class KeywordRule:
     """关键字替换规则类"""
     
+    # 规则数量可能较多，使用__slots__去掉每个实例的__dict__
+    __slots__ = ('pattern', 'replacement', 'font_settings', 'use_regex', 'replace_content', 'replace_font',
+                 '_compiled_pattern', '_processed_replacement', '_html_style', '_html_open')
+    
     def __init__(self, pattern: str, replacement: str = "", font_settings: Optional[Dict[str, Any]] = None, 
                  use_regex: bool = False, replace_content: bool = True, replace_font: bool = False) -> None:
         """
@@ -28,21 +51,28 @@ class KeywordRule:
             replace_content: 是否替换内容
             replace_font: 是否替换字体
         """
-        self.pattern = pattern
-        self.replacement = replacement
+        # 不同规则间常有重复的模式和替换文本，驻留后共享同一字符串对象
+        self.pattern = sys.intern(pattern)
+        self.replacement = sys.intern(replacement)
         self.font_settings = font_settings or {}
         self.use_regex = use_regex
         self.replace_content = replace_content
         self.replace_font = replace_font
         self._compiled_pattern: Optional[re.Pattern] = None  # type: ignore
+        # 替换文本中的Unicode转义序列只在构造时处理一次
+        self._processed_replacement = self._decode_escapes(replacement)
+        # HTML样式及其开始标签只在构造时生成一次
+        self._html_style = self._build_html_style()
+        self._html_open = f"<span style='{self._html_style}'>"
         
-        # 如果使用正则表达式，则编译它以提高性能
+        # 如果使用正则表达式，则在构造时编译，匹配时只使用编译后的模式
         if self.use_regex:
             try:
-                self._compiled_pattern = re.compile(pattern)
+                self._compiled_pattern = compile_pattern(pattern)
             except re.error as e:
-                logger.error(f"无效的正则表达式 '{pattern}': {e}")
-                self._compiled_pattern = None
+                # 编译失败时按普通字符串匹配处理，编辑规则时对话框已提示过用户
+                logger.warning(f"关键字规则 '{pattern}' -> '{replacement}' 的正则表达式无效，将按普通字符串匹配: {e}")
+                self.use_regex = False
     
     def match(self, text: str) -> bool:
         """
@@ -54,13 +84,8 @@ class KeywordRule:
         Returns:
             bool: 如果匹配返回True，否则返回False
         """
-        if self.use_regex and self._compiled_pattern:
-            return bool(self._compiled_pattern.search(text))
-        elif self.use_regex:
-            try:
-                return bool(re.search(self.pattern, text))
-            except re.error:
-                return False
+        if self.use_regex:
+            return bool(self._compiled_pattern.search(text))  # type: ignore
         else:
             return self.pattern in text
     
@@ -76,30 +101,60 @@ class KeywordRule:
         """
         if not self.replace_content:
             return text
+        return self.replace_and_count(text)[0]
+    
+    @staticmethod
+    def _decode_escapes(replacement: str) -> str:
+        """
+        处理替换文本中的Unicode转义序列
+        
+        Args:
+            replacement: 原始替换文本
             
-        # 处理Unicode转义序列（仅当包含反斜杠时才处理）
-        processed_replacement = self.replacement
-        if '\\' in self.replacement:
-            try:
-                processed_replacement = self.replacement.encode().decode('unicode_escape')
-            except Exception as e:
-                logger.warning(f"处理Unicode转义序列失败 '{self.replacement}': {e}")
-                processed_replacement = self.replacement
+        Returns:
+            str: 处理后的替换文本，处理失败时返回原始替换文本
+        """
+        # 仅当包含反斜杠时才处理
+        if '\\' not in replacement:
+            return replacement
+        try:
+            return replacement.encode().decode('unicode_escape')
+        except Exception as e:
+            logger.warning(f"处理Unicode转义序列失败 '{replacement}': {e}")
+            return replacement
+    
+    def get_processed_replacement(self) -> str:
+        """
+        获取处理Unicode转义序列后的替换文本
+        
+        Returns:
+            str: 处理后的替换文本
+        """
+        return self._processed_replacement
+    
+    def replace_and_count(self, text: str) -> Tuple[str, int]:
+        """
+        在一次扫描中完成内容替换并统计替换次数
+        
+        Args:
+            text: 原始文本
             
-        if self.use_regex and self._compiled_pattern:
-            try:
-                return self._compiled_pattern.sub(processed_replacement, text)
-            except re.error as e:
-                logger.error(f"正则表达式替换失败 '{self.pattern}' -> '{processed_replacement}': {e}")
-                return text
-        elif self.use_regex:
+        Returns:
+            tuple: (替换后的文本, 替换次数)，替换次数为0表示未匹配
+        """
+        processed_replacement = self._processed_replacement
+            
+        if self.use_regex:
             try:
-                return re.sub(self.pattern, processed_replacement, text)
+                return self._compiled_pattern.subn(processed_replacement, text)  # type: ignore
             except re.error as e:
                 logger.error(f"正则表达式替换失败 '{self.pattern}' -> '{processed_replacement}': {e}")
-                return text
+                return text, 0
         else:
-            return text.replace(self.pattern, processed_replacement)
+            count = text.count(self.pattern)
+            if count == 0:
+                return text, 0
+            return text.replace(self.pattern, processed_replacement), count
     
     def apply_font_replacement(self, font: QFont) -> QFont:
         """
@@ -142,6 +197,15 @@ class KeywordRule:
         """
         获取HTML样式字符串
         
+        Returns:
+            str: HTML样式字符串
+        """
+        return self._html_style
+    
+    def _build_html_style(self) -> str:
+        """
+        根据字体设置生成HTML样式字符串
+        
         Returns:
             str: HTML样式字符串
         """
@@ -172,17 +236,109 @@ class KeywordRule:
         return "; ".join(styles)
 
 
+def _overlaps(a: str, b: str) -> bool:
+    """
+    检查两个字符串在拼接或包含时是否可能互相重叠
+    
+    Args:
+        a: 第一个字符串
+        b: 第二个字符串
+        
+    Returns:
+        bool: 一个包含另一个，或一个的后缀是另一个的前缀时返回True
+    """
+    if not a or not b:
+        return False
+    if a in b or b in a:
+        return True
+    for k in range(1, min(len(a), len(b))):
+        if a.endswith(b[:k]) or b.endswith(a[:k]):
+            return True
+    return False
+
+
+class _CombinedLiteralRules:
+    """多条仅替换内容的普通字符串规则合并而成的单次扫描替换"""
+    
+    def __init__(self, rules: List[KeywordRule]) -> None:
+        """
+        初始化合并规则
+        
+        Args:
+            rules: 要合并的规则，调用方需保证它们可以安全地合并
+        """
+        self.rules = rules
+        self._replacements: Dict[str, str] = {rule.pattern: rule.get_processed_replacement() for rule in rules}
+        self._pattern = re.compile("|".join(re.escape(rule.pattern) for rule in rules))
+    
+    def apply(self, text: str) -> str:
+        """
+        对文本执行一次扫描完成所有规则的替换
+        
+        Args:
+            text: 原始文本
+            
+        Returns:
+            str: 替换后的文本
+        """
+        replacements = self._replacements
+        return self._pattern.sub(lambda m: replacements[m.group()], text)
+    
+    @staticmethod
+    def can_join(group: List[KeywordRule], rule: KeywordRule) -> bool:
+        """
+        检查规则能否加入合并组而不改变逐条顺序替换的结果
+        
+        逐条替换时，后面的规则会作用于前面规则的输出；合并后只扫描一次原文。
+        只有各模式之间、以及后加入的模式与前面规则的替换文本之间都不可能重叠时，
+        两种方式的结果才一致。
+        
+        Args:
+            group: 已合并的规则
+            rule: 待加入的规则
+            
+        Returns:
+            bool: 是否可以合并
+        """
+        for earlier in group:
+            if _overlaps(earlier.pattern, rule.pattern):
+                return False
+            earlier_replacement = earlier.get_processed_replacement()
+            if _overlaps(earlier_replacement, rule.pattern):
+                return False
+            # 删除文本会使两侧内容相邻，可能拼出新的多字符匹配
+            if not earlier_replacement and len(rule.pattern) > 1:
+                return False
+        return True
+
+
 class KeywordReplacer:
     """关键字替换处理器"""
     
-    def __init__(self) -> None:
-        """初始化关键字替换处理器"""
+    def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
+        """
+        初始化关键字替换处理器
+        
+        Args:
+            config: 配置字典（可选），调用方已持有配置时传入可避免重新读取配置文件
+        """
         self.rules: List[KeywordRule] = []
-        self._load_rules_from_config()
+        # 处理步骤，由规则整理而来，可安全合并的普通字符串规则只扫描一次文本
+        self._steps: List[Union[KeywordRule, _CombinedLiteralRules]] = []
+        # HTML渲染的预筛选数据：生效的普通字符串规则模式，以及是否存在生效的正则规则
+        self._literal_prefilter: Tuple[str, ...] = ()
+        self._has_active_regex: bool = False
+        self._load_rules_from_config(config)
     
-    def _load_rules_from_config(self) -> None:
-        """从配置中加载规则"""
-        config = load_config()
+    def _load_rules_from_config(self, config: Optional[Dict[str, Any]] = None) -> None:
+        """
+        从配置中加载规则
+        
+        Args:
+            config: 配置字典（可选），未提供时从配置文件读取
+        """
+        if config is None:
+            config = load_config()
         rules_data = config.get("keyword_replacements")
         
         self.rules = []
@@ -201,6 +357,45 @@ class KeywordReplacer:
                         self.rules.append(rule)
                     except Exception as e:
                         logger.error(f"加载关键字替换规则失败: {e}")
+        self._steps = self._build_steps(self.rules)
+        
+        active_rules = [r for r in self.rules if r.replace_content or r.replace_font]
+        self._has_active_regex = any(r.use_regex for r in active_rules)
+        self._literal_prefilter = tuple({r.pattern for r in active_rules if not r.use_regex and r.pattern})
+    
+    @staticmethod
+    def _build_steps(rules: List[KeywordRule]) -> List[Union[KeywordRule, _CombinedLiteralRules]]:
+        """
+        将规则整理为处理步骤，把相邻的、可安全合并的仅替换内容的普通字符串规则合并为一次扫描
+        
+        Args:
+            rules: 按顺序排列的规则
+            
+        Returns:
+            list: 处理步骤，元素为单条规则或合并规则
+        """
+        steps: List[Union[KeywordRule, _CombinedLiteralRules]] = []
+        group: List[KeywordRule] = []
+        
+        def flush() -> None:
+            if len(group) > 1:
+                steps.append(_CombinedLiteralRules(list(group)))
+            else:
+                steps.extend(group)
+            group.clear()
+        
+        for rule in rules:
+            simple = rule.replace_content and not rule.replace_font and not rule.use_regex and rule.pattern
+            if simple and _CombinedLiteralRules.can_join(group, rule):
+                group.append(rule)
+                continue
+            flush()
+            if simple:
+                group.append(rule)
+            else:
+                steps.append(rule)
+        flush()
+        return steps
     
     def process(self, text: str, font: Optional[QFont] = None) -> Tuple[str, Optional[QFont]]:
         """
@@ -216,14 +411,21 @@ class KeywordReplacer:
         processed_text = text
         processed_font = QFont(font) if font else None
         
-        # 应用每条规则
-        for rule in self.rules:
-            # 检查是否匹配
-            if rule.match(processed_text):
-                # 应用内容替换
-                if rule.replace_content:
-                    processed_text = rule.apply_content_replacement(processed_text)
-                
+        # 按顺序应用每个处理步骤
+        for rule in self._steps:
+            # 合并的普通字符串规则只替换内容，一次扫描完成
+            if isinstance(rule, _CombinedLiteralRules):
+                processed_text = rule.apply(processed_text)
+                continue
+            
+            # 替换内容的规则在替换的同时得到是否匹配，无需额外扫描一次
+            if rule.replace_content:
+                processed_text, count = rule.replace_and_count(processed_text)
+                matched = count > 0
+            else:
+                matched = rule.match(processed_text)
+            
+            if matched:
                 # 应用字体替换
                 if rule.replace_font:
                     if processed_font:
@@ -247,6 +449,11 @@ class KeywordReplacer:
         if not self.rules:
             return html.escape(text)
         
+        # 快速预筛选：没有正则规则且原文不含任何普通字符串模式时，没有规则会修改文本，
+        # 后续规则看到的始终是原文，因此整段跳过逐规则扫描（结果与逐条处理无匹配时一致）
+        if not self._has_active_regex and not any(p in text for p in self._literal_prefilter):
+            return text
+        
         # 创建一个副本用于处理
         processed_text: str = text
         
@@ -259,64 +466,44 @@ class KeywordReplacer:
             if not rule.replace_content and not rule.replace_font:
                 continue
                 
-            # 查找所有匹配项
-            matches: List[Union[re.Match, Any]] = []
-            if rule.use_regex and rule._compiled_pattern:
-                matches = list(rule._compiled_pattern.finditer(processed_text))
-            elif rule.use_regex:
-                try:
-                    matches = list(re.finditer(rule.pattern, processed_text))
-                except re.error:
-                    continue
-            else:
-                # 处理普通字符串匹配
+            # 查找所有匹配项，统一记录为 (起始位置, 结束位置, 匹配文本, 正则展开函数) 元组
+            # 普通字符串匹配没有展开函数，记为None
+            matches: List[Tuple[int, int, str, Optional[Callable[[str], str]]]] = []
+            if rule.use_regex:
+                matches = [(m.start(), m.end(), m.group(), m.expand)
+                           for m in rule._compiled_pattern.finditer(processed_text)]  # type: ignore
+            elif rule.pattern:
+                # 处理普通字符串匹配（空模式会在同一位置无限匹配，直接跳过）
+                pattern = rule.pattern
+                pattern_length = len(pattern)
                 start = 0
                 while True:
-                    pos = processed_text.find(rule.pattern, start)
+                    pos = processed_text.find(pattern, start)
                     if pos == -1:
                         break
-                    # 创建一个模拟match对象
-                    class SimpleMatch:
-                        def __init__(self, start: int, end: int, group: str):
-                            self._start = start
-                            self._end = end
-                            self._group = group
-                            
-                        def start(self) -> int:
-                            return self._start
-                            
-                        def end(self) -> int:
-                            return self._end
-                            
-                        def group(self) -> str:
-                            return self._group
-                    
-                    match_obj = SimpleMatch(pos, pos + len(rule.pattern), rule.pattern)
-                    matches.append(match_obj)
-                    start = pos + len(rule.pattern)
+                    matches.append((pos, pos + pattern_length, pattern, None))
+                    start = pos + pattern_length
+            
+            if not matches:
+                continue
             
             # 对每个匹配项进行处理
-            # 从后往前替换，避免位置偏移问题
-            for match in reversed(matches):
+            # 按位置顺序把未匹配的片段和替换结果依次放入列表，最后一次性拼接
+            parts: List[str] = []
+            cursor = 0
+            for match_start, match_end, matched_text, expand in matches:
                 # 处理匹配的文本
-                matched_text: str = str(match.group())
                 replacement_text: str = matched_text
                 
                 # 应用内容替换
                 if rule.replace_content:
-                    # 处理Unicode转义序列
-                    processed_replacement = rule.replacement
-                    if '\\' in rule.replacement:
-                        try:
-                            processed_replacement = rule.replacement.encode().decode('unicode_escape')
-                        except Exception as e:
-                            logger.warning(f"处理Unicode转义序列失败 '{rule.replacement}': {e}")
-                            processed_replacement = rule.replacement
+                    # 已处理Unicode转义序列的替换文本
+                    processed_replacement = rule._processed_replacement
                     
                     # 执行替换
-                    if rule.use_regex:
+                    if expand is not None:
                         try:
-                            replacement_text = str(match.expand(processed_replacement))
+                            replacement_text = str(expand(processed_replacement))
                         except re.error:
                             replacement_text = processed_replacement
                     else:
@@ -324,28 +511,32 @@ class KeywordReplacer:
                 
                 # 应用字体样式（通过HTML）
                 if rule.replace_font:
-                    style = rule.get_html_style()
-                    if style:
+                    if rule._html_style:
                         # 先对内容进行HTML转义，再包裹span标签
-                        escaped_text: str = html.escape(replacement_text)
-                        replacement_text = f"<span style='{style}'>{escaped_text}</span>"
+                        replacement_text = rule._html_open + html.escape(replacement_text) + "</span>"
                     else:
                         replacement_text = html.escape(replacement_text)
                 else:
                     replacement_text = html.escape(replacement_text)
                 
                 # 替换文本
-                processed_text = (
-                    processed_text[:match.start()] + 
-                    replacement_text + 
-                    processed_text[match.end():]
-                )
+                parts.append(processed_text[cursor:match_start])
+                parts.append(replacement_text)
+                cursor = match_end
+            
+            parts.append(processed_text[cursor:])
+            processed_text = "".join(parts)
         
         return processed_text
     
-    def reload_rules(self) -> None:
-        """重新加载规则"""
-        self._load_rules_from_config()
+    def reload_rules(self, config: Optional[Dict[str, Any]] = None) -> None:
+        """
+        重新加载规则
+        
+        Args:
+            config: 配置字典（可选），未提供时从配置文件读取
+        """
+        self._load_rules_from_config(config)
 
 
 # 全局关键字替换器实例
@@ -394,7 +585,16 @@ def process_text_with_html(text: str) -> str:
     return replacer.process_with_html(text)
 
 
-def reload_keyword_rules() -> None:
-    """重新加载关键字替换规则（当配置发生变化时调用）"""
-    replacer = get_replacer()
-    replacer.reload_rules()
\ No newline at end of file
+def reload_keyword_rules(config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    重新加载关键字替换规则（当配置发生变化时调用）
+    
+    Args:
+        config: 已加载的配置字典（可选），传入时不再重新读取配置文件
+    """
+    global _replacer
+    if _replacer is None:
+        # 尚未创建时直接用给定配置创建，避免创建后立即再加载一次
+        _replacer = KeywordReplacer(config)
+        return
+    _replacer.reload_rules(config)
\ No newline at end of file
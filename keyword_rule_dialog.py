@@ -5,16 +5,22 @@
 
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
                                QLineEdit, QCheckBox, QPushButton, QLabel,
-                               QDialogButtonBox, QGroupBox)
+                               QDialogButtonBox, QGroupBox, QMessageBox)
 from PySide6.QtWidgets import QWidget as QWidgetType
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QFontDialog
-from typing import Dict, Union
+from typing import Dict, Optional, Tuple, Union
+import regex as re
+from keyword_replacer import compile_pattern
+from logger_config import logger
 
 
 class KeywordRuleDialog(QDialog):
     """关键字规则编辑对话框"""
 
+    # 预览字体缓存，相同字体设置的规则共享同一个QFont
+    _font_cache: Dict[Tuple[str, int, bool, bool, bool, int], QFont] = {}
+
     def __init__(self, rule_data: Union[Dict[str, Union[str, float, int, bool, None]], None] = None, 
                  parent: Union[QWidgetType, None] = None) -> None:
         """
@@ -26,6 +32,8 @@ class KeywordRuleDialog(QDialog):
         """
         super().__init__(parent)
         self.rule_data = rule_data or {}
+        # 预览字体只在启用字体替换时才根据规则数据生成
+        self._preview_loaded = False
         self.setWindowTitle("编辑关键字规则")
         self.setModal(True)
         self.resize(500, 400)
@@ -58,6 +66,7 @@ class KeywordRuleDialog(QDialog):
         font_group = QGroupBox("字体替换")
         font_layout = QVBoxLayout()
         self.replace_font_checkbox = QCheckBox("替换字体")
+        self.replace_font_checkbox.toggled.connect(self._on_replace_font_toggled)
         font_layout.addWidget(self.replace_font_checkbox)
 
         # 字体设置
@@ -109,6 +118,53 @@ class KeywordRuleDialog(QDialog):
             self.font_family_edit.setText(font.family())
             # 更新预览
             self.font_preview_label.setFont(font)
+            self._preview_loaded = True
+
+    @classmethod
+    def _get_font(cls, font_settings: Dict[str, Union[str, float, int, bool, None]]) -> QFont:
+        """
+        根据字体设置获取预览字体，相同设置只构造一次
+
+        Args:
+            font_settings: 字体设置
+
+        Returns:
+            QFont: 预览字体
+        """
+        family = str(font_settings.get("family", ""))
+        size = float(font_settings.get("size", 48.0) or 48.0)
+        weight = int(font_settings.get("weight", 50) or 50)
+        key = (family, round(size * 10),
+               bool(font_settings.get("bold", False)),
+               bool(font_settings.get("italic", False)),
+               bool(font_settings.get("underline", False)),
+               weight)
+        font = cls._font_cache.get(key)
+        if font is None:
+            font = QFont()
+            if family:
+                font.setFamily(family)
+            font.setPointSizeF(size)
+            font.setBold(key[2])
+            font.setItalic(key[3])
+            font.setUnderline(key[4])
+            font.setWeight(QFont.Weight(weight))
+            cls._font_cache[key] = font
+        return font
+
+    def _ensure_preview_font(self) -> None:
+        """根据规则数据生成预览字体（仅在首次需要时执行）"""
+        if self._preview_loaded:
+            return
+        self._preview_loaded = True
+        font_settings = self.rule_data.get("font_settings", {})
+        if isinstance(font_settings, dict):
+            self.font_preview_label.setFont(self._get_font(font_settings))
+
+    def _on_replace_font_toggled(self, checked: bool) -> None:
+        """启用字体替换时加载预览字体"""
+        if checked:
+            self._ensure_preview_font()
 
     def _load_data(self) -> None:
         """加载规则数据到界面"""
@@ -116,6 +172,7 @@ class KeywordRuleDialog(QDialog):
         self.regex_checkbox.setChecked(bool(self.rule_data.get("use_regex", False)))
         self.replace_content_checkbox.setChecked(bool(self.rule_data.get("replace_content", False)))
         self.replacement_edit.setText(str(self.rule_data.get("replacement", "")))
+        # 勾选时通过toggled信号加载预览字体，未启用字体替换时不生成预览字体
         self.replace_font_checkbox.setChecked(bool(self.rule_data.get("replace_font", False)))
 
         font_settings = self.rule_data.get("font_settings", {})
@@ -123,20 +180,40 @@ class KeywordRuleDialog(QDialog):
             family = str(font_settings.get("family", ""))
             self.font_family_edit.setText(family)
 
-            # 创建预览字体
-            preview_font = QFont()
-            if family:
-                preview_font.setFamily(family)
-            size = float(font_settings.get("size", 48.0) or 48.0)
-            preview_font.setPointSizeF(size)
-            preview_font.setBold(bool(font_settings.get("bold", False)))
-            preview_font.setItalic(bool(font_settings.get("italic", False)))
-            preview_font.setUnderline(bool(font_settings.get("underline", False)))
-            weight = int(font_settings.get("weight", 50) or 50)
-            preview_font.setWeight(QFont.Weight(weight))
+    def _check_regex(self) -> Optional[str]:
+        """
+        检查启用正则表达式时匹配内容能否编译
 
-            # 更新预览
-            self.font_preview_label.setFont(preview_font)
+        有效时编译结果进入缓存，加载规则时直接复用
+
+        Returns:
+            Optional[str]: 无效时返回错误信息，有效或未启用正则表达式时返回None
+        """
+        if not self.regex_checkbox.isChecked():
+            return None
+        try:
+            compile_pattern(self.pattern_edit.text())
+        except re.error as e:
+            return str(e)
+        return None
+
+    def accept(self) -> None:
+        """保存规则，正则表达式无效时提示用户该规则将按普通字符串匹配"""
+        error = self._check_regex()
+        if error is not None:
+            pattern = self.pattern_edit.text()
+            logger.warning(f"无效的正则表达式 '{pattern}'，将按普通字符串匹配: {error}")
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle("正则表达式无效")
+            msg_box.setText(f"正则表达式 '{pattern}' 无效，保存后该规则将按普通字符串匹配。\n\n{error}")
+            msg_box.setIcon(QMessageBox.Icon.Warning)
+            save_button = msg_box.addButton("仍然保存", QMessageBox.ButtonRole.AcceptRole)
+            edit_button = msg_box.addButton("返回修改", QMessageBox.ButtonRole.RejectRole)
+            msg_box.setDefaultButton(edit_button)
+            msg_box.exec()
+            if msg_box.clickedButton() is not save_button:
+                return
+        super().accept()
 
     def get_rule_data(self) -> Dict[str, Union[str, float, int, bool, None, Dict[str, Union[str, float, int, bool, None]]]]:
         """获取规则数据"""
@@ -151,12 +228,14 @@ class KeywordRuleDialog(QDialog):
         if self.replace_font_checkbox.isChecked():
             # 从预览标签获取当前字体设置
             current_font = self.font_preview_label.font()
+            # QFont的取值方法已直接返回str/float/bool，无需再转换；
+            # weight()返回QFont.Weight枚举，需转为int才能保存到配置文件
             font_settings: Dict[str, Union[str, float, int, bool, None]] = {
-                "family": str(current_font.family()),
-                "size": float(current_font.pointSizeF()),
-                "bold": bool(current_font.bold()),
-                "italic": bool(current_font.italic()),
-                "underline": bool(current_font.underline()),
+                "family": current_font.family(),
+                "size": current_font.pointSizeF(),
+                "bold": current_font.bold(),
+                "italic": current_font.italic(),
+                "underline": current_font.underline(),
                 "weight": int(current_font.weight())
             }
             rule_data["font_settings"] = font_settings
@@ -8,9 +8,10 @@ import os
 import sys
 import struct
 from datetime import datetime
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 from cryptography.hazmat.backends import default_backend
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
@@ -25,6 +26,13 @@ from icon_manager import load_icon
 # wmi库缺少类型提示，忽略类型检查
 import wmi  # type: ignore
 
+# RSA许可证签名验证使用的哈希算法和填充方式，与签发程序保持一致，模块加载时构造一次
+_SHA512 = hashes.SHA512()
+_PSS = padding.PSS(
+    mgf=padding.MGF1(_SHA512),
+    salt_length=padding.PSS.MAX_LENGTH
+)
+
 def get_resource_path(relative_path: str) -> str:
     """获取资源文件的绝对路径，采用与配置文件相同的策略"""
     base_dir: str
@@ -53,6 +61,78 @@ def get_executable_dir() -> str:
         return os.path.dirname(os.path.abspath(sys.argv[0]))
 
 
+def _der_path(pem_path: str) -> str:
+    """获取与PEM密钥文件同名的DER密钥文件路径
+    
+    Args:
+        pem_path: PEM密钥文件路径
+        
+    Returns:
+        str: DER密钥文件路径
+    """
+    return os.path.splitext(pem_path)[0] + ".der"
+
+
+def _select_key_file(pem_path: str) -> Tuple[str, bool]:
+    """选择要加载的密钥文件
+    
+    同名DER文件不比PEM文件旧时使用DER格式（无需PEM的base64解码）；
+    PEM文件被替换后旁边残留的旧DER文件会被忽略，避免使用过期的密钥。
+    
+    Args:
+        pem_path: PEM密钥文件路径
+        
+    Returns:
+        tuple: (密钥文件路径, 是否为DER格式)
+    """
+    der_path = _der_path(pem_path)
+    try:
+        der_mtime = os.stat(der_path).st_mtime_ns
+    except OSError:
+        return pem_path, False
+    try:
+        pem_mtime = os.stat(pem_path).st_mtime_ns
+    except OSError:
+        # 只有DER文件
+        return der_path, True
+    if der_mtime >= pem_mtime:
+        return der_path, True
+    logger.warning(f"DER密钥文件早于PEM密钥文件，已忽略并改用PEM: {der_path}")
+    return pem_path, False
+
+
+def _load_public_key_file(pem_path: str) -> Any:
+    """加载公钥文件，同名DER文件不比PEM文件旧时优先使用DER格式
+    
+    Args:
+        pem_path: PEM公钥文件路径
+        
+    Returns:
+        公钥对象
+    """
+    key_path, is_der = _select_key_file(pem_path)
+    with open(key_path, "rb") as key_file:
+        if is_der:
+            return serialization.load_der_public_key(key_file.read(), backend=default_backend())
+        return serialization.load_pem_public_key(key_file.read(), backend=default_backend())
+
+
+def _load_private_key_file(pem_path: str) -> Any:
+    """加载私钥文件，同名DER文件不比PEM文件旧时优先使用DER格式
+    
+    Args:
+        pem_path: PEM私钥文件路径
+        
+    Returns:
+        私钥对象
+    """
+    key_path, is_der = _select_key_file(pem_path)
+    with open(key_path, "rb") as key_file:
+        if is_der:
+            return serialization.load_der_private_key(key_file.read(), password=None, backend=default_backend())
+        return serialization.load_pem_private_key(key_file.read(), password=None, backend=default_backend())
+
+
 class LicenseManager:
     """许可证管理器"""
     
@@ -179,6 +259,14 @@ class LicenseManager:
         final_hash = hashlib.sha3_384(sha3_512_hash.encode('utf-8')).hexdigest()
         return final_hash
     
+    def _custom_public_key_exists(self) -> bool:
+        """检查自定义公钥文件（PEM或DER格式）是否存在
+        
+        Returns:
+            bool: 自定义公钥文件是否存在
+        """
+        return os.path.exists(self.custom_public_key_file) or os.path.exists(_der_path(self.custom_public_key_file))
+    
     def load_public_key(self) -> Any:
         """加载公钥
         
@@ -187,18 +275,13 @@ class LicenseManager:
         """
         try:
             # 检查自定义公钥文件是否存在，如果存在则优先使用
-            if os.path.exists(self.custom_public_key_file):
+            if self._custom_public_key_exists():
                 logger.info("检测到自定义公钥文件，将优先使用")
                 public_key_path = self.custom_public_key_file
             else:
                 public_key_path = self.public_key_file
             
-            with open(public_key_path, "rb") as key_file:
-                public_key = serialization.load_pem_public_key(
-                    key_file.read(),
-                    backend=default_backend()
-                )
-            return public_key
+            return _load_public_key_file(public_key_path)
         except Exception as e:
             logger.error(f"加载公钥失败: {e}")
             return None
@@ -210,13 +293,7 @@ class LicenseManager:
             私钥对象
         """
         try:
-            with open(self.private_key_file, "rb") as key_file:
-                private_key = serialization.load_pem_private_key(
-                    key_file.read(),
-                    password=None,
-                    backend=default_backend()
-                )
-            return private_key
+            return _load_private_key_file(self.private_key_file)
         except Exception as e:
             logger.error(f"加载私钥失败: {e}")
             return None
@@ -234,7 +311,7 @@ class LicenseManager:
                 return False
             
             # 检查公钥文件是否存在（自定义公钥优先）
-            if os.path.exists(self.custom_public_key_file):
+            if self._custom_public_key_exists():
                 logger.info("使用自定义公钥文件进行验证")
                 public_key_path = self.custom_public_key_file
             elif os.path.exists(self.public_key_file):
@@ -248,15 +325,26 @@ class LicenseManager:
             with open(self.license_file, "rb") as f:
                 license_data = f.read()
             
+            # 加载公钥，签名长度由密钥类型决定
+            public_key = _load_public_key_file(public_key_path)
+            
+            if not public_key:
+                logger.error("无法加载公钥进行签名验证")
+                return False
+            
+            # Ed25519签名固定为64字节，RSA签名长度等于密钥长度（RSA-4096为512字节）
+            is_ed25519 = isinstance(public_key, Ed25519PublicKey)
+            signature_length = 64 if is_ed25519 else public_key.key_size // 8  # type: ignore
+            
             # 解析二进制许可证数据
             # 格式: [license_data_bytes][signature_bytes]
-            # 需要从后往前解析，因为签名长度固定为512字节（RSA-4096）
-            if len(license_data) < 512:
+            # 需要从后往前解析，因为签名长度固定
+            if len(license_data) < signature_length:
                 logger.error("许可证格式无效：数据长度不足")
                 return False
                 
-            signature = license_data[-512:]  # 签名固定为512字节
-            license_content = license_data[:-512]  # 剩余部分为许可证内容
+            signature = license_data[-signature_length:]
+            license_content = license_data[:-signature_length]  # 剩余部分为许可证内容
             
             # 解析许可证内容
             # 格式: [licensee_length(4字节)][licensee_bytes][expiration_timestamp(8字节)][hardware_key_length(4字节)][hardware_key_bytes]
@@ -316,27 +404,17 @@ class LicenseManager:
                 logger.error(f"当前硬件标识: {current_hardware_key}")
                 return False
             
-            # 验证签名
-            with open(public_key_path, "rb") as key_file:
-                public_key = serialization.load_pem_public_key(
-                    key_file.read(),
-                    backend=default_backend()
-                )
-            
-            if not public_key:
-                logger.error("无法加载公钥进行签名验证")
-                return False
-            
             try:
                 # 验证签名
+                if is_ed25519:
+                    public_key.verify(signature, license_content)  # type: ignore
+                    logger.info("许可证验证成功")
+                    return True
                 public_key.verify( # type: ignore
                     signature,
                     license_content,
-                    padding.PSS(
-                        mgf=padding.MGF1(hashes.SHA512()),
-                        salt_length=padding.PSS.MAX_LENGTH
-                    ), # type: ignore
-                    hashes.SHA512() # type: ignore
+                    _PSS, # type: ignore
+                    _SHA512 # type: ignore
                 )
                 logger.info("许可证验证成功")
                 return True
@@ -394,7 +472,9 @@ class LicenseInfoWorker(QThread):
                 license_data = f.read()
             
             # 解析二进制许可证数据
-            if len(license_data) < 512:
+            # 签名长度因密钥类型而异（RSA-4096为512字节，Ed25519为64字节），
+            # 而许可证内容的各字段都带有长度前缀，因此直接从头解析，忽略末尾的签名
+            if len(license_data) < 64:
                 return {
                     "licensee": "许可证格式无效",
                     "status": "无效",
@@ -402,10 +482,7 @@ class LicenseInfoWorker(QThread):
                     "hardware_key": "未知"
                 }
                 
-            signature = license_data[-512:]  # 签名固定为512字节
-            # 确保变量被使用
-            _ = signature
-            license_content = license_data[:-512]
+            license_content = license_data
             
             # 解析许可证内容
             offset = 0
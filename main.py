@@ -24,6 +24,7 @@ from send_notification_dialog import SendNotificationDialog
 from banner_factory import create_banner  # 导入横幅工厂
 from license_manager import LicenseManager  # 导入许可证管理器
 from keyword_replacer import reload_keyword_rules  # 导入关键字替换规则重载函数
+from icon_manager import preload_default_icon  # 导入默认图标预加载函数
 from typing import Optional, List, Tuple, Union, Callable, cast, Dict
 
 
@@ -124,6 +125,9 @@ QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSibli
 # 初始化Qt应用程序
 app = QApplication(sys.argv)
 
+# 预先加载默认图标，托盘、横幅等组件的图标回退路径直接复用
+preload_default_icon()
+
 # 检查实际的渲染状态
 rendering_backend = config.get("rendering_backend", "default")
 if enable_qt_quick:
@@ -574,8 +578,8 @@ class ToastBannerManager(QObject):
             # 重新加载配置
             self.config = load_config()
             
-            # 重新加载关键字替换规则
-            reload_keyword_rules()
+            # 重新加载关键字替换规则，直接使用刚加载的配置
+            reload_keyword_rules(self.config)
             
             # 更新日志等级
             setup_logger(self.config)
@@ -747,8 +751,8 @@ class ToastBannerManager(QObject):
         # 重新加载配置
         self.config = load_config()
         
-        # 重新加载关键字替换规则
-        reload_keyword_rules()
+        # 重新加载关键字替换规则，直接使用刚加载的配置
+        reload_keyword_rules(self.config)
         
         # 重新初始化日志系统
         setup_logger(self.config)
@@ -10,7 +10,7 @@ from PySide6.QtGui import QIcon, QPixmap, Qt, QAction
 from PySide6.QtCore import QObject
 from logger_config import logger
 from config import load_config
-from icon_manager import load_icon, get_resource_path
+from icon_manager import load_icon, get_scaled_icon
 from license_manager import LicenseManager  # 导入许可证管理器
 from typing import Optional, Callable, Dict, Union
 
@@ -419,43 +419,13 @@ class TrayManager(QObject):
                 if custom_icon and not custom_icon.isNull():
                     # 根据系统DPI缩放比例设置图标尺寸，避免在高分辨率屏幕上模糊
                     if custom_icon.availableSizes():
-                        scaled_icon = QIcon(custom_icon.pixmap(icon_size, icon_size))
+                        scaled_icon = get_scaled_icon(custom_icon, icon_size)
                         self.tray_icon.showMessage(title, message, scaled_icon, timeout)
                     else:
                         self.tray_icon.showMessage(title, message, custom_icon, timeout)
                 else:
-                    # 如果没有自定义图标，尝试使用默认资源图标
-                    try:
-                        resource_icon_path = get_resource_path("notification_icon.ico")
-                        if os.path.exists(resource_icon_path):
-                            resource_icon = QIcon(resource_icon_path)
-                            if not resource_icon.isNull():
-                                # 根据系统DPI缩放比例设置图标尺寸，避免在高分辨率屏幕上模糊
-                                if resource_icon.availableSizes():
-                                    scaled_icon = QIcon(resource_icon.pixmap(icon_size, icon_size))
-                                    self.tray_icon.showMessage(title, message, scaled_icon, timeout)
-                                else:
-                                    self.tray_icon.showMessage(title, message, resource_icon, timeout)
-                            else:
-                                self.tray_icon.showMessage(title, message, icon, timeout)
-                        else:
-                            # 尝试使用notification_icon.png
-                            resource_icon_path = get_resource_path("notification_icon.png")
-                            if os.path.exists(resource_icon_path):
-                                resource_icon = QIcon(resource_icon_path)
-                                if not resource_icon.isNull():
-                                    # 根据系统DPI缩放比例设置图标尺寸，避免在高分辨率屏幕上模糊
-                                    if resource_icon.availableSizes():
-                                        scaled_icon = QIcon(resource_icon.pixmap(icon_size, icon_size))
-                                        self.tray_icon.showMessage(title, message, scaled_icon, timeout)
-                                    else:
-                                        self.tray_icon.showMessage(title, message, resource_icon, timeout)
-                                else:
-                                    self.tray_icon.showMessage(title, message, icon, timeout)
-                            else:
-                                self.tray_icon.showMessage(title, message, icon, timeout)
-                    except Exception:
-                        self.tray_icon.showMessage(title, message, icon, timeout)
+                    # load_icon 已依次回退到内置ICO、PNG和系统主题图标，仍为空时使用系统消息图标
+                    self.tray_icon.showMessage(title, message, icon, timeout)
         except Exception as e:
             logger.error(f"显示托盘消息时出错: {e}")
             